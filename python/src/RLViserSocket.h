@@ -453,8 +453,24 @@ struct GameState {
         4 +     // num_pads
         4;      // num_cars
     
+    // Ball state size: pos(12) + rotMat(36) + vel(12) + angVel(12) + hs(12) = 84
+    static constexpr size_t BALL_STATE_BYTES = 12 + 36 + 12 + 12 + 12;
+    
+    size_t num_bytes() const {
+        return MIN_NUM_BYTES + BALL_STATE_BYTES +
+               pads.size() * BoostPadInfo::NUM_BYTES +
+               cars.size() * CarInfo::NUM_BYTES;
+    }
+    
     std::vector<uint8_t> to_bytes() const {
         ByteWriter w;
+        write(w);
+        return std::move(w.data);
+    }
+    
+    // Append the packet to w, so callers that send repeatedly can reuse one buffer
+    void write(ByteWriter& w) const {
+        w.data.reserve(w.data.size() + num_bytes());
         
         // Header
         w.write_u64(tickCount);
@@ -475,8 +491,6 @@ struct GameState {
         for (const auto& car : cars) {
             car.write(w);
         }
-        
-        return w.data;
     }
     
     static size_t get_num_bytes(const uint8_t* data, size_t size) {
@@ -489,9 +503,6 @@ struct GameState {
         uint32_t num_pads = r.read_u32();
         uint32_t num_cars = r.read_u32();
         
-        // Ball state size: pos(12) + rotMat(36) + vel(12) + angVel(12) + hs(12) = 84
-        static constexpr size_t BALL_STATE_BYTES = 12 + 36 + 12 + 12 + 12;
-        
         return MIN_NUM_BYTES + 
                BALL_STATE_BYTES +
                num_pads * BoostPadInfo::NUM_BYTES + 
@@ -538,6 +549,7 @@ struct GameState {
         state.ball.state = arena->ball->GetState();
         
         // Pads
+        state.pads.reserve(arena->GetBoostPads().size());
         for (BoostPad* pad : arena->GetBoostPads()) {
             BoostPadInfo info;
             BoostPadState padState = pad->GetState();
@@ -549,6 +561,7 @@ struct GameState {
         }
         
         // Cars
+        state.cars.reserve(arena->GetCars().size());
         for (Car* car : arena->GetCars()) {
             CarInfo info;
             info.id = car->id;
@@ -583,8 +596,9 @@ private:
     bool is_initialized_ = false;
     bool is_connected_ = false;
     
-    // Buffers for receiving
+    // Send/receive buffers
     std::vector<uint8_t> recv_buffer_;
+    ByteWriter send_buffer_;  // Reused by send_game_state(), keeps its capacity between frames
     uint8_t header_buffer_[GameState::MIN_NUM_BYTES];
     
     // State tracking
@@ -700,7 +714,9 @@ public:
                (sockaddr*)&rlviser_addr_, sizeof(rlviser_addr_));
         
         // Send game state bytes
-        auto bytes = state.to_bytes();
+        send_buffer_.data.clear();
+        state.write(send_buffer_);
+        const auto& bytes = send_buffer_.data;
         sendto(socket_, (const char*)bytes.data(), bytes.size(), 0,
                (sockaddr*)&rlviser_addr_, sizeof(rlviser_addr_));
         
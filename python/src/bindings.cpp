@@ -5,6 +5,7 @@
 #include <nanobind/stl/unordered_map.h>
 #include <nanobind/stl/optional.h>
 #include <nanobind/stl/tuple.h>
+#include <nanobind/stl/array.h>
 #include <nanobind/ndarray.h>
 
 #include "RocketSim.h"
@@ -35,43 +36,41 @@ using namespace nb::literals;
 using namespace RocketSim;
 
 // ============================================================================
-// GymState - Efficient pre-allocated state container for RLGym
+// Event callback calls
 // ============================================================================
-struct GymState {
-    // Ball state: pos(3) + vel(3) + ang_vel(3) = 9 floats
-    // Plus rotation matrix: 9 floats = 18 total
-    static constexpr size_t BALL_STATE_SIZE = 18;
-    
-    // Car state: pos(3) + vel(3) + ang_vel(3) + rot_mat(9) + boost(1) + 
-    // on_ground(1) + has_jumped(1) + has_double_jumped(1) + has_flipped(1) + 
-    // is_demoed(1) + on_wall(1) + supersonic(1) = 25 floats
-    static constexpr size_t CAR_STATE_SIZE = 25;
-    
-    std::vector<float> ball_data;
-    std::vector<float> cars_data;
-    std::vector<float> pads_data;
-    std::vector<float> game_data; // [blue_score, orange_score, tick_count]
-    
-    size_t num_cars = 0;
-    size_t num_pads = 0;
-    
-    void resize(size_t cars, size_t pads) {
-        if (cars != num_cars) {
-            cars_data.resize(cars * CAR_STATE_SIZE);
-            num_cars = cars;
-        }
-        if (pads != num_pads) {
-            pads_data.resize(pads);
-            num_pads = pads;
-        }
-        if (ball_data.size() != BALL_STATE_SIZE) {
-            ball_data.resize(BALL_STATE_SIZE);
-        }
-        if (game_data.size() != 3) {
-            game_data.resize(3);
+// Python callbacks get keyword arguments. Each event builds its tuple of keyword
+// names once (interned, like Python's own call sites), so a callback call
+// is a single vectorcall instead of re-creating the names every time.
+static PyObject* callback_keywords(std::initializer_list<const char*> names) {
+    nb::list list;
+    for (const char* name : names) {
+        list.append(nb::steal(PyUnicode_InternFromString(name)));
+    }
+    // Kept for the life of the process, like the interned names themselves
+    return nb::tuple(list).release().ptr();
+}
+
+// A get_gym_state() dict key, interned and kept for the life of the process
+static nb::handle gym_state_key(const char* name) {
+    return PyUnicode_InternFromString(name);
+}
+
+template <typename... Args>
+void call_with_keywords(const nb::object& callback, PyObject* kwnames, const Args&... args) {
+    nb::object values[] = { nb::cast(args, nb::rv_policy::reference)... };
+    PyObject* stack[1 + sizeof...(Args)] = { nullptr };
+    for (size_t i = 0; i < sizeof...(Args); i++) {
+        if (!values[i].is_valid()) {
+            values[i] = nb::none();
         }
+        stack[i + 1] = values[i].ptr();
     }
-};
+    PyObject* result = PyObject_Vectorcall(callback.ptr(), stack + 1, PY_VECTORCALL_ARGUMENTS_OFFSET, kwnames);
+    if (!result) {
+        throw nb::python_error();
+    }
+    Py_DECREF(result);
+}
 
 // ============================================================================
 // ArenaWrapper - Wraps Arena with Python callbacks and stat tracking
@@ -104,8 +103,11 @@ struct ArenaWrapper {
     nb::object ball_touch_callback;
     nb::object ball_touch_data;
     
-    // Reusable gym state buffer
-    GymState gym_state;
+    // Boost pads split by size, in get_boost_pads() order (pads never change after creation)
+    std::vector<BoostPad*> big_pads;
+    std::vector<BoostPad*> small_pads;
+    // get_boost_pads() result, built on first call; a tuple so callers can't edit it
+    nb::object boost_pads_cache;
     
     // Track last gym state tick for ball_touched detection
     uint64_t last_gym_state_tick = 0;
@@ -166,6 +168,21 @@ struct ArenaWrapper {
         
         arena.reset(Arena::Create(mode, config, tick_rate));
         setup_callbacks();
+        split_boost_pads();
+    }
+    
+    // Adopt an already-built arena (used by clone to skip building a throwaway world)
+    explicit ArenaWrapper(Arena* existing)
+        : arena(existing, [](Arena* a) { if (a) delete a; })
+    {
+        setup_callbacks();
+        split_boost_pads();
+    }
+    
+    void split_boost_pads() {
+        for (BoostPad* pad : arena->GetBoostPads()) {
+            (pad->config.isBig ? big_pads : small_pads).push_back(pad);
+        }
     }
     
     void setup_callbacks() {
@@ -182,11 +199,9 @@ struct ArenaWrapper {
                 if (self->goal_score_callback) {
                     nb::gil_scoped_acquire gil;
                     try {
-                        self->goal_score_callback(
-                            "arena"_a = nb::cast(self, nb::rv_policy::reference),
-                            "scoring_team"_a = team,
-                            "data"_a = self->goal_score_data
-                        );
+                        static PyObject* const kwnames = callback_keywords({"arena", "scoring_team", "data"});
+                        call_with_keywords(self->goal_score_callback, kwnames,
+                                           self, team, self->goal_score_data);
                     } catch (...) {
                         self->store_exception_and_stop();
                     }
@@ -205,12 +220,9 @@ struct ArenaWrapper {
                 if (self->car_demo_callback) {
                     nb::gil_scoped_acquire gil;
                     try {
-                        self->car_demo_callback(
-                            "arena"_a = nb::cast(self, nb::rv_policy::reference),
-                            "bumper"_a = nb::cast(bumper, nb::rv_policy::reference),
-                            "victim"_a = nb::cast(victim, nb::rv_policy::reference),
-                            "data"_a = self->car_demo_data
-                        );
+                        static PyObject* const kwnames = callback_keywords({"arena", "bumper", "victim", "data"});
+                        call_with_keywords(self->car_demo_callback, kwnames,
+                                           self, bumper, victim, self->car_demo_data);
                     } catch (...) {
                         self->store_exception_and_stop();
                     }
@@ -221,13 +233,9 @@ struct ArenaWrapper {
             if (self->car_bump_callback) {
                 nb::gil_scoped_acquire gil;
                 try {
-                    self->car_bump_callback(
-                        "arena"_a = nb::cast(self, nb::rv_policy::reference),
-                        "bumper"_a = nb::cast(bumper, nb::rv_policy::reference),
-                        "victim"_a = nb::cast(victim, nb::rv_policy::reference),
-                        "is_demo"_a = isDemo,
-                        "data"_a = self->car_bump_data
-                    );
+                    static PyObject* const kwnames = callback_keywords({"arena", "bumper", "victim", "is_demo", "data"});
+                    call_with_keywords(self->car_bump_callback, kwnames,
+                                       self, bumper, victim, isDemo, self->car_bump_data);
                 } catch (...) {
                     self->store_exception_and_stop();
                 }
@@ -247,12 +255,9 @@ struct ArenaWrapper {
                 if (self->boost_pickup_callback) {
                     nb::gil_scoped_acquire gil;
                     try {
-                        self->boost_pickup_callback(
-                            "arena"_a = nb::cast(self, nb::rv_policy::reference),
-                            "car"_a = nb::cast(car, nb::rv_policy::reference),
-                            "boost_pad"_a = nb::cast(pad, nb::rv_policy::reference),
-                            "data"_a = self->boost_pickup_data
-                        );
+                        static PyObject* const kwnames = callback_keywords({"arena", "car", "boost_pad", "data"});
+                        call_with_keywords(self->boost_pickup_callback, kwnames,
+                                           self, car, pad, self->boost_pickup_data);
                     } catch (...) {
                         self->store_exception_and_stop();
                     }
@@ -261,17 +266,84 @@ struct ArenaWrapper {
         }
     }
     
+    // Ball touch callback, installed only while a Python callback is set
+    static void on_ball_touch(Arena* a, Car* car, void* userInfo) {
+        auto* self = static_cast<ArenaWrapper*>(userInfo);
+        if (self->ball_touch_callback) {
+            nb::gil_scoped_acquire gil;
+            try {
+                static PyObject* const kwnames = callback_keywords({"arena", "car", "data"});
+                call_with_keywords(self->ball_touch_callback, kwnames,
+                                   self, car, self->ball_touch_data);
+            } catch (...) {
+                self->store_exception_and_stop();
+            }
+        }
+    }
+    
     Car* add_car(Team team, const CarConfig& config) {
         Car* car = arena->AddCar(team, config);
         car_stats[car->id] = CarStats{};
         return car;
     }
     
+    // Add one car per team entry, returning the new ids as a numpy int32 array
+    nb::ndarray<nb::numpy, int32_t> add_cars(const std::vector<Team>& teams, const CarConfig& config) {
+        auto* ids = new std::vector<int32_t>();
+        nb::capsule owner(ids, [](void* p) noexcept { delete static_cast<std::vector<int32_t>*>(p); });
+        ids->reserve(teams.size());
+        for (Team team : teams) {
+            ids->push_back(static_cast<int32_t>(add_car(team, config)->id));
+        }
+        return nb::ndarray<nb::numpy, int32_t>(ids->data(), {ids->size()}, owner);
+    }
+    
+    // Same, from an int32 array of team values (0 blue, 1 orange) such as gym_state["car_teams"];
+    // every value is checked before any car is added
+    nb::ndarray<nb::numpy, int32_t> add_cars_array(
+            nb::ndarray<const int32_t, nb::ndim<1>, nb::c_contig, nb::device::cpu> teams, const CarConfig& config) {
+        std::vector<Team> checked;
+        checked.reserve(teams.shape(0));
+        for (size_t i = 0; i < teams.shape(0); i++) {
+            int32_t team = teams(i);
+            if (team != (int32_t)Team::BLUE && team != (int32_t)Team::ORANGE) {
+                throw std::invalid_argument("Invalid team value " + std::to_string(team) + " (expected 0 or 1)");
+            }
+            checked.push_back(static_cast<Team>(team));
+        }
+        return add_cars(checked, config);
+    }
+    
     void remove_car(Car* car) {
         car_stats.erase(car->id);
         arena->RemoveCar(car);
     }
     
+    // Remove several cars in one call; every id is checked before any car is removed
+    void remove_cars(const std::vector<uint32_t>& ids) {
+        for (uint32_t id : ids) {
+            if (!arena->GetCar(id)) {
+                throw std::invalid_argument("No car with id " + std::to_string(id));
+            }
+        }
+        for (uint32_t id : ids) {
+            car_stats.erase(id);
+            arena->RemoveCar(id);
+        }
+    }
+    
+    void clear_cars() {
+        std::vector<uint32_t> ids;
+        ids.reserve(arena->GetCars().size());
+        for (Car* car : arena->GetCars()) {
+            ids.push_back(car->id);
+        }
+        for (uint32_t id : ids) {
+            arena->RemoveCar(id);
+        }
+        car_stats.clear();
+    }
+    
     void step(int ticks = 1) {
         // Clear any previous exceptions
         clear_exception();
@@ -305,18 +377,13 @@ struct ArenaWrapper {
     }
     
     ArenaWrapper* clone(bool copy_callbacks = false) {
-        auto* cloned = new ArenaWrapper(arena->gameMode, arena->GetTickRate());
-        // Copy the arena state
-        delete cloned->arena.release();
-        cloned->arena = std::unique_ptr<Arena, void(*)(Arena*)>(
-            arena->Clone(copy_callbacks), [](Arena* a) { delete a; }
-        );
-        cloned->setup_callbacks();
+        auto* cloned = new ArenaWrapper(arena->Clone(copy_callbacks));
         cloned->blue_score = blue_score;
         cloned->orange_score = orange_score;
         cloned->car_stats = car_stats;
         
-        // Copy Python callbacks if requested
+        // Copy Python callbacks if requested. Callbacks and their data are shared
+        // with the clone (one reference each), never deep-copied
         if (copy_callbacks) {
             cloned->goal_score_callback = goal_score_callback;
             cloned->goal_score_data = goal_score_data;
@@ -330,30 +397,85 @@ struct ArenaWrapper {
             cloned->ball_touch_data = ball_touch_data;
             // Re-setup ball touch callback on clone if it was set
             if (cloned->ball_touch_callback) {
-                cloned->arena->SetBallTouchCallback([](Arena* a, Car* car, void* userInfo) {
-                    auto* self = static_cast<ArenaWrapper*>(userInfo);
-                    if (self->ball_touch_callback) {
-                        nb::gil_scoped_acquire gil;
-                        try {
-                            self->ball_touch_callback(
-                                "arena"_a = nb::cast(self, nb::rv_policy::reference),
-                                "car"_a = nb::cast(car, nb::rv_policy::reference),
-                                "data"_a = self->ball_touch_data
-                            );
-                        } catch (...) {
-                            self->store_exception_and_stop();
-                        }
-                    }
-                }, cloned);
+                cloned->arena->SetBallTouchCallback(&ArenaWrapper::on_ball_touch, cloned);
             }
         }
         return cloned;
     }
     
+    // Serialize arena state plus scores and per-car stats (callbacks are not included)
+    nb::bytes serialize() const {
+        DataStreamOut out;
+        out.Write<uint32_t>(RS_VERSION_ID);
+        // The arena section is length-prefixed so deserialize() can reject truncated
+        // data before the engine reads past the end
+        out.Write<uint32_t>(0);
+        size_t arena_start = out.data.size();
+        arena->Serialize(out);
+        uint32_t arena_size = out.data.size() - arena_start;
+        memcpy(out.data.data() + arena_start - sizeof(uint32_t), &arena_size, sizeof(uint32_t));
+        out.Write<int32_t>(blue_score);
+        out.Write<int32_t>(orange_score);
+        out.Write<uint32_t>(car_stats.size());
+        for (const auto& [id, stats] : car_stats) {
+            out.Write<uint32_t>(id);
+            out.Write<int32_t>(stats.goals);
+            out.Write<int32_t>(stats.demos);
+            out.Write<int32_t>(stats.boost_pickups);
+        }
+        return nb::bytes(reinterpret_cast<const char*>(out.data.data()), out.data.size());
+    }
+    
+    static ArenaWrapper* deserialize(nb::bytes data) {
+        DataStreamIn in;
+        const auto* begin = reinterpret_cast<const byte*>(data.c_str());
+        in.data.assign(begin, begin + data.size());
+        if (in.data.size() < 2 * sizeof(uint32_t) || !in.DoVersionCheck()) {
+            throw std::invalid_argument("Arena data is invalid or from a different version of RocketSim");
+        }
+        
+        uint32_t arena_size = in.Read<uint32_t>();
+        if (in.GetNumBytesLeft() < arena_size) {
+            throw std::invalid_argument("Arena data is truncated");
+        }
+        size_t arena_end = in.pos + arena_size;
+        
+        Arena* arena_ptr;
+        try {
+            arena_ptr = Arena::DeserializeNew(in);
+        } catch (const std::runtime_error& e) {
+            throw std::invalid_argument(std::string("Arena data is invalid: ") + e.what());
+        }
+        auto* restored = new ArenaWrapper(arena_ptr);
+        if (in.pos != arena_end) {
+            delete restored;
+            throw std::invalid_argument("Arena data is invalid or from a different version of RocketSim");
+        }
+        restored->blue_score = in.Read<int32_t>();
+        restored->orange_score = in.Read<int32_t>();
+        uint32_t num_stats = in.Read<uint32_t>();
+        for (uint32_t i = 0; i < num_stats && !in.IsOverflown(); i++) {
+            auto& stats = restored->car_stats[in.Read<uint32_t>()];
+            stats.goals = in.Read<int32_t>();
+            stats.demos = in.Read<int32_t>();
+            stats.boost_pickups = in.Read<int32_t>();
+        }
+        
+        if (in.IsOverflown()) {
+            delete restored;
+            throw std::invalid_argument("Arena data is truncated");
+        }
+        return restored;
+    }
+    
     // ========================================================================
     // Efficient gym state getters - return numpy arrays with minimal overhead
     // ========================================================================
     
+    // Row sizes: ball is pos, vel, ang_vel, rot_mat; car adds boost, 6 state flags and ball_touched
+    static constexpr size_t BALL_STATE_SIZE = 18;
+    static constexpr size_t CAR_STATE_SIZE = 26;
+    
     // Helper: Write ball state to array at offset, optionally inverted
     // Inversion mirrors coordinates for opposing team perspective: (-x, -y, z)
     static void write_ball_state(float* data, const BallState& bs, bool inverted) {
@@ -394,130 +516,401 @@ struct ArenaWrapper {
         data[25] = ball_touched ? 1.0f : 0.0f;
     }
     
+    // Whether arr has exactly this shape
+    template <typename T>
+    static bool has_shape(const nb::ndarray<T, nb::c_contig, nb::device::cpu>& arr, std::initializer_list<size_t> shape) {
+        if (arr.ndim() != shape.size())
+            return false;
+        size_t dim = 0;
+        for (size_t len : shape) {
+            if (arr.shape(dim++) != len)
+                return false;
+        }
+        return true;
+    }
+    
+    // Destination for a state array getter. A given out must be a writable float32
+    // C-contiguous array of exactly this shape; with out=None a new array is made
+    // and stored in out, so the caller always returns out
+    static float* state_array_out(nb::object& out, std::initializer_list<size_t> shape) {
+        if (out.is_none()) {
+            size_t size = 1;
+            for (size_t len : shape)
+                size *= len;
+            float* data = new float[size];
+            nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
+            out = nb::cast(nb::ndarray<nb::numpy, float>(data, shape, owner));
+            return data;
+        }
+        
+        nb::ndarray<float, nb::c_contig, nb::device::cpu> arr;
+        if (!nb::try_cast(out, arr, false) || !has_shape(arr, shape)) {
+            std::string dims;
+            for (size_t len : shape)
+                dims += (dims.empty() ? "" : ", ") + std::to_string(len);
+            if (shape.size() == 1)
+                dims += ",";
+            throw std::invalid_argument("out must be a writable C-contiguous float32 array of shape (" + dims + ")");
+        }
+        return arr.data();
+    }
+    
     // Get ball state array
     // If inverted=false: returns shape (18,) with normal view
     // If inverted=true: returns shape (2, 18) with [normal, inverted] views
-    nb::ndarray<nb::numpy, float> get_ball_state(bool inverted = false) {
+    nb::object get_ball_state(bool inverted = false, nb::object out = nb::none()) {
         BallState bs = arena->ball->GetState();
         
         if (!inverted) {
-            float* data = new float[18];
-            write_ball_state(data, bs, false);
-            nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
-            return nb::ndarray<nb::numpy, float>(data, {18}, owner);
+            write_ball_state(state_array_out(out, {BALL_STATE_SIZE}), bs, false);
         } else {
-            float* data = new float[2 * 18];
-            write_ball_state(data, bs, false);        // Row 0: normal
-            write_ball_state(data + 18, bs, true);    // Row 1: inverted
-            nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
-            return nb::ndarray<nb::numpy, float>(data, {2, 18}, owner);
+            float* data = state_array_out(out, {2, BALL_STATE_SIZE});
+            write_ball_state(data, bs, false);                      // Row 0: normal
+            write_ball_state(data + BALL_STATE_SIZE, bs, true);     // Row 1: inverted
         }
+        return out;
     }
     
     // Get single car state array
     // If inverted=false: returns shape (26,) with normal view
     // If inverted=true: returns shape (2, 26) with [normal, inverted] views
-    nb::ndarray<nb::numpy, float> get_car_state(Car* car, bool inverted = false) {
+    nb::object get_car_state(Car* car, bool inverted = false, nb::object out = nb::none()) {
         CarState cs = car->GetState();
         bool ball_touched = cs.ballHitInfo.isValid && 
                            cs.ballHitInfo.tickCountWhenHit >= last_gym_state_tick;
         
         if (!inverted) {
-            float* data = new float[26];
-            write_car_state(data, cs, false, ball_touched);
-            nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
-            return nb::ndarray<nb::numpy, float>(data, {26}, owner);
+            write_car_state(state_array_out(out, {CAR_STATE_SIZE}), cs, false, ball_touched);
         } else {
-            float* data = new float[2 * 26];
-            write_car_state(data, cs, false, ball_touched);       // Row 0: normal
-            write_car_state(data + 26, cs, true, ball_touched);   // Row 1: inverted
-            nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
-            return nb::ndarray<nb::numpy, float>(data, {2, 26}, owner);
+            float* data = state_array_out(out, {2, CAR_STATE_SIZE});
+            write_car_state(data, cs, false, ball_touched);                     // Row 0: normal
+            write_car_state(data + CAR_STATE_SIZE, cs, true, ball_touched);     // Row 1: inverted
+        }
+        return out;
+    }
+    
+    // Write every car's row(s) into one contiguous buffer, in GetCars() order
+    // Rows are CAR_STATE_SIZE floats; inverted adds a mirrored row after each normal one
+    void fill_cars_state(float* data, bool inverted) {
+        size_t stride = inverted ? 2 * CAR_STATE_SIZE : CAR_STATE_SIZE;
+        for (Car* car : arena->GetCars()) {
+            CarState cs = car->GetState();
+            bool ball_touched = cs.ballHitInfo.isValid && 
+                               cs.ballHitInfo.tickCountWhenHit >= last_gym_state_tick;
+            write_car_state(data, cs, false, ball_touched);                       // Row 0: normal
+            if (inverted)
+                write_car_state(data + CAR_STATE_SIZE, cs, true, ball_touched);   // Row 1: inverted
+            data += stride;
         }
     }
     
     // Get all cars state array
     // If inverted=false: returns shape (N, 26) with normal views
     // If inverted=true: returns shape (N, 2, 26) with [normal, inverted] views per car
-    nb::ndarray<nb::numpy, float> get_cars_state(bool inverted = false) {
+    nb::object get_cars_state(bool inverted = false, nb::object out = nb::none()) {
+        size_t n = arena->GetCars().size();
+        float* data = inverted ? state_array_out(out, {n, 2, CAR_STATE_SIZE})
+                               : state_array_out(out, {n, CAR_STATE_SIZE});
+        fill_cars_state(data, inverted);
+        return out;
+    }
+    
+    // Car ids in get_cars_state_array() row order
+    nb::ndarray<nb::numpy, int32_t> get_car_ids() {
         const auto& cars = arena->GetCars();
         size_t n = cars.size();
+        int32_t* data = new int32_t[n];
         
-        if (!inverted) {
-            float* data = new float[n * 26];
-            size_t i = 0;
-            for (Car* car : cars) {
-                CarState cs = car->GetState();
-                bool ball_touched = cs.ballHitInfo.isValid && 
-                                   cs.ballHitInfo.tickCountWhenHit >= last_gym_state_tick;
-                write_car_state(data + i * 26, cs, false, ball_touched);
-                i++;
-            }
-            nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
-            return nb::ndarray<nb::numpy, float>(data, {n, 26}, owner);
-        } else {
-            float* data = new float[n * 2 * 26];
-            size_t i = 0;
-            for (Car* car : cars) {
-                CarState cs = car->GetState();
-                bool ball_touched = cs.ballHitInfo.isValid && 
-                                   cs.ballHitInfo.tickCountWhenHit >= last_gym_state_tick;
-                float* base = data + i * 2 * 26;
-                write_car_state(base, cs, false, ball_touched);       // Row 0: normal
-                write_car_state(base + 26, cs, true, ball_touched);   // Row 1: inverted
-                i++;
+        for (size_t i = 0; i < n; i++) {
+            data[i] = static_cast<int32_t>(cars[i]->id);
+        }
+        
+        nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<int32_t*>(p); });
+        return nb::ndarray<nb::numpy, int32_t>(data, {n}, owner);
+    }
+    
+    // [goals, demos, boost_pickups] per car, for the given ids or else every car in
+    // get_car_ids() order; unknown ids get zeros like the single-stat getters
+    nb::ndarray<nb::numpy, int32_t> get_car_stats_array(const std::optional<std::vector<uint32_t>>& ids) {
+        std::vector<uint32_t> all_ids;
+        if (!ids) {
+            for (Car* car : arena->GetCars()) {
+                all_ids.push_back(car->id);
             }
-            nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
-            return nb::ndarray<nb::numpy, float>(data, {n, 2, 26}, owner);
         }
+        const std::vector<uint32_t>& rows = ids ? *ids : all_ids;
+        size_t n = rows.size();
+        int32_t* data = new int32_t[n * 3];
+        
+        for (size_t i = 0; i < n; i++) {
+            auto it = car_stats.find(rows[i]);
+            CarStats stats = it != car_stats.end() ? it->second : CarStats{};
+            data[i * 3 + 0] = stats.goals;
+            data[i * 3 + 1] = stats.demos;
+            data[i * 3 + 2] = stats.boost_pickups;
+        }
+        
+        nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<int32_t*>(p); });
+        return nb::ndarray<nb::numpy, int32_t>(data, {n, 3}, owner);
     }
     
-    nb::ndarray<nb::numpy, float> get_pads_state() {
+    // Pad activity as 0/1 floats, in get_boost_pads() order
+    void fill_pads_state(float* data) {
+        const auto& pads = arena->GetBoostPads();
+        for (size_t i = 0; i < pads.size(); i++) {
+            data[i] = pads[i]->GetState().isActive ? 1.0f : 0.0f;
+        }
+    }
+    
+    nb::object get_pads_state(nb::object out = nb::none()) {
+        fill_pads_state(state_array_out(out, {arena->GetBoostPads().size()}));
+        return out;
+    }
+    
+    // Which pads are big, in get_boost_pads() order (fixed for the arena's lifetime)
+    nb::ndarray<nb::numpy, bool> get_pads_is_big() {
+        const auto& pads = arena->GetBoostPads();
+        size_t n = pads.size();
+        bool* data = new bool[n];
+        
+        for (size_t i = 0; i < n; i++) {
+            data[i] = pads[i]->config.isBig;
+        }
+        
+        nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<bool*>(p); });
+        return nb::ndarray<nb::numpy, bool>(data, {n}, owner);
+    }
+    
+    // Pad activity and cooldowns as packed arrays, in get_boost_pads() order
+    nb::ndarray<nb::numpy, bool> get_pads_is_active() {
+        const auto& pads = arena->GetBoostPads();
+        size_t n = pads.size();
+        bool* data = new bool[n];
+        
+        for (size_t i = 0; i < n; i++) {
+            data[i] = pads[i]->GetState().isActive;
+        }
+        
+        nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<bool*>(p); });
+        return nb::ndarray<nb::numpy, bool>(data, {n}, owner);
+    }
+    
+    // Pad activity packed 8 pads per byte, least significant bit first
+    // (np.unpackbits(bits, bitorder="little")[:M] gives the active mask back)
+    nb::ndarray<nb::numpy, uint8_t> get_pads_is_active_bits() {
+        const auto& pads = arena->GetBoostPads();
+        size_t n = pads.size();
+        size_t num_bytes = (n + 7) / 8;
+        uint8_t* data = new uint8_t[num_bytes]();
+        
+        for (size_t i = 0; i < n; i++) {
+            data[i / 8] |= (uint8_t)(pads[i]->GetState().isActive) << (i % 8);
+        }
+        
+        nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<uint8_t*>(p); });
+        return nb::ndarray<nb::numpy, uint8_t>(data, {num_bytes}, owner);
+    }
+    
+    nb::ndarray<nb::numpy, float> get_pads_cooldown() {
         const auto& pads = arena->GetBoostPads();
         size_t n = pads.size();
         float* data = new float[n];
         
         for (size_t i = 0; i < n; i++) {
-            data[i] = pads[i]->GetState().isActive ? 1.0f : 0.0f;
+            data[i] = pads[i]->GetState().cooldown;
         }
         
         nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
         return nb::ndarray<nb::numpy, float>(data, {n}, owner);
     }
     
+    // Buffer for out[key]: the existing array if it is a writable C-contiguous array
+    // of this dtype and shape, otherwise a new array stored under key
+    template <typename T>
+    static T* gym_state_buffer(nb::dict& out, nb::handle key, std::initializer_list<size_t> shape) {
+        PyObject* existing = PyDict_GetItemWithError(out.ptr(), key.ptr());  // borrowed
+        if (existing) {
+            nb::ndarray<T, nb::c_contig, nb::device::cpu> arr;
+            if (nb::try_cast(nb::handle(existing), arr, false) && has_shape(arr, shape))
+                return arr.data();
+        } else if (PyErr_Occurred()) {
+            throw nb::python_error();
+        }
+        
+        size_t size = 1;
+        for (size_t len : shape)
+            size *= len;
+        T* data = new T[size];
+        nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<T*>(p); });
+        out[key] = nb::ndarray<nb::numpy, T>(data, shape, owner);
+        return data;
+    }
+    
     // Full gym state in one call - most efficient for RLGym
     // If inverted=true, ball and cars arrays include both normal and inverted views
     // Ball shape: (18,) or (2, 18), Cars shape: (N, 26) or (N, 2, 26)
-    nb::dict get_gym_state(bool inverted = false) {
-        nb::dict result;
-        result["ball"] = get_ball_state(inverted);
-        result["cars"] = get_cars_state(inverted);
-        result["pads"] = get_pads_state();
-        result["blue_score"] = blue_score;
-        result["orange_score"] = orange_score;
-        result["tick_count"] = arena->tickCount;
+    // Passing a previous result as out refills its arrays in place; any whose shape
+    // no longer fits (e.g. a car was added) is replaced
+    nb::dict get_gym_state(bool inverted = false, std::optional<nb::dict> out = std::nullopt) {
+        // Keys are interned once, so no per-call str objects are built for them
+        static const nb::handle
+            key_ball = gym_state_key("ball"), key_cars = gym_state_key("cars"),
+            key_pads = gym_state_key("pads"), key_car_ids = gym_state_key("car_ids"),
+            key_car_teams = gym_state_key("car_teams"), key_blue_score = gym_state_key("blue_score"),
+            key_orange_score = gym_state_key("orange_score"), key_tick_count = gym_state_key("tick_count");
         
-        // Car IDs in same order as cars array
-        nb::list car_ids;
-        for (Car* car : arena->GetCars()) {
-            car_ids.append(car->id);
+        nb::dict result = out ? *out : nb::dict();
+        size_t num_cars = arena->GetCars().size();
+        size_t num_pads = arena->GetBoostPads().size();
+        
+        BallState bs = arena->ball->GetState();
+        if (!inverted) {
+            write_ball_state(gym_state_buffer<float>(result, key_ball, {BALL_STATE_SIZE}), bs, false);
+            fill_cars_state(gym_state_buffer<float>(result, key_cars, {num_cars, CAR_STATE_SIZE}), false);
+        } else {
+            float* ball = gym_state_buffer<float>(result, key_ball, {2, BALL_STATE_SIZE});
+            write_ball_state(ball, bs, false);
+            write_ball_state(ball + BALL_STATE_SIZE, bs, true);
+            fill_cars_state(gym_state_buffer<float>(result, key_cars, {num_cars, 2, CAR_STATE_SIZE}), true);
         }
-        result["car_ids"] = car_ids;
         
-        // Car teams in same order
-        nb::list car_teams;
+        fill_pads_state(gym_state_buffer<float>(result, key_pads, {num_pads}));
+        
+        result[key_blue_score] = blue_score;
+        result[key_orange_score] = orange_score;
+        result[key_tick_count] = arena->tickCount;
+        
+        // Car IDs and teams (0 blue, 1 orange) in same order as cars array
+        int32_t* car_ids = gym_state_buffer<int32_t>(result, key_car_ids, {num_cars});
+        int32_t* car_teams = gym_state_buffer<int32_t>(result, key_car_teams, {num_cars});
+        size_t i = 0;
         for (Car* car : arena->GetCars()) {
-            car_teams.append(static_cast<int>(car->team));
+            car_ids[i] = static_cast<int32_t>(car->id);
+            car_teams[i] = static_cast<int32_t>(car->team);
+            i++;
         }
-        result["car_teams"] = car_teams;
         
         // Update last_gym_state_tick for next call's ball_touched detection
         last_gym_state_tick = arena->tickCount;
         
         return result;
     }
+    
+    // Step one tick at a time and record ball, cars and pads after every tick, like
+    // calling step(1) and get_gym_state() in a loop but with one GIL release
+    nb::tuple rollout(int ticks, nb::object ball_out, nb::object cars_out, nb::object pads_out) {
+        if (ticks < 0) {
+            throw std::invalid_argument("ticks must be non-negative");
+        }
+        size_t n = ticks;
+        size_t num_cars = arena->GetCars().size();
+        size_t num_pads = arena->GetBoostPads().size();
+        float* ball = state_array_out(ball_out, {n, BALL_STATE_SIZE});
+        float* cars = state_array_out(cars_out, {n, num_cars, CAR_STATE_SIZE});
+        float* pads = state_array_out(pads_out, {n, num_pads});
+        
+        // Rows are only meaningful for the cars present at the start; ids are never
+        // reused, so comparing them also catches a remove followed by an add
+        std::vector<uint32_t> car_ids;
+        car_ids.reserve(num_cars);
+        for (Car* car : arena->GetCars()) {
+            car_ids.push_back(car->id);
+        }
+        auto same_cars = [&]() {
+            const auto& current = arena->GetCars();
+            if (current.size() != num_cars)
+                return false;
+            for (size_t j = 0; j < num_cars; j++) {
+                if (current[j]->id != car_ids[j])
+                    return false;
+            }
+            return true;
+        };
+        
+        clear_exception();
+        bool cars_changed = false;
+        {
+            nb::gil_scoped_release release;
+            for (size_t i = 0; i < n; i++) {
+                arena->Step(1);
+                if (has_exception())
+                    break;
+                // A callback could have added or removed cars; the rows no longer fit
+                if (!same_cars()) {
+                    cars_changed = true;
+                    break;
+                }
+                write_ball_state(ball + i * BALL_STATE_SIZE, arena->ball->GetState(), false);
+                fill_cars_state(cars + i * num_cars * CAR_STATE_SIZE, false);
+                fill_pads_state(pads + i * num_pads);
+                last_gym_state_tick = arena->tickCount;
+            }
+        }
+        
+        check_and_rethrow();
+        if (cars_changed) {
+            throw std::runtime_error("Cars were added or removed during rollout()");
+        }
+        return nb::make_tuple(ball_out, cars_out, pads_out);
+    }
+};
+
+// ============================================================================
+// Raw buffers for plain state structs
+// ============================================================================
+// to_buffer() copies the struct as-is behind a header of RS_VERSION_ID and the
+// struct size, and from_buffer() copies it back. The layout is that of this build
+// on this architecture, so a buffer from a different build is rejected rather than
+// misread. Pickling uses the portable per-field __getstate__ format instead.
+struct StateBufferHeader {
+    uint32_t version;
+    uint32_t size;
 };
 
+template <typename T>
+nb::bytes state_to_buffer(const T& state) {
+    static_assert(std::is_trivially_copyable_v<T>, "state must be memcpy-able");
+    T copy = state;
+#if defined(__has_builtin)
+#if __has_builtin(__builtin_clear_padding)
+    // Padding would otherwise carry whatever bytes the source happened to hold
+    // (GCC 11+; other compilers leave it as is, so don't compare buffers bytewise)
+    __builtin_clear_padding(&copy);
+#endif
+#endif
+
+    StateBufferHeader header{ RS_VERSION_ID, (uint32_t)sizeof(T) };
+    std::string data(sizeof(header) + sizeof(T), '\0');
+    memcpy(data.data(), &header, sizeof(header));
+    memcpy(data.data() + sizeof(header), &copy, sizeof(T));
+    return nb::bytes(data.data(), data.size());
+}
+
+template <typename T>
+T state_from_buffer(nb::handle buffer) {
+    Py_buffer view;
+    if (PyObject_GetBuffer(buffer.ptr(), &view, PyBUF_SIMPLE) != 0) {
+        throw nb::python_error();
+    }
+
+    T state;
+    StateBufferHeader header{};
+    bool valid = (size_t)view.len == sizeof(header) + sizeof(T);
+    if (valid) {
+        memcpy(&header, view.buf, sizeof(header));
+        valid = header.version == RS_VERSION_ID && header.size == sizeof(T);
+    }
+    if (valid) {
+        memcpy(&state, (const char*)view.buf + sizeof(header), sizeof(T));
+    }
+    PyBuffer_Release(&view);
+
+    if (!valid) {
+        throw std::invalid_argument("State buffer was written by a different RocketSim build");
+    }
+    return state;
+}
+
 // ============================================================================
 // Module definition
 // ============================================================================
@@ -526,8 +919,12 @@ NB_MODULE(RocketSim, m) {
 
     // ========== Module-level init function ==========
     m.def("init", [](const std::string& path) {
+        // Init() would re-read every mesh file before noticing it's already done
+        if (RocketSim::GetStage() != RocketSimStage::UNINITIALIZED)
+            return;
         RocketSim::Init(path);
-    }, "collision_meshes_path"_a, "Initialize RocketSim with path to collision meshes directory");
+    }, "collision_meshes_path"_a,
+       "Initialize RocketSim with path to collision meshes directory (later calls are no-ops)");
 
     // ========== GameMode enum ==========
     nb::enum_<GameMode>(m, "GameMode")
@@ -583,9 +980,23 @@ NB_MODULE(RocketSim, m) {
             return std::make_tuple(a.x, a.y, a.z) >= std::make_tuple(b.x, b.y, b.z);
         })
         .def("__hash__", [](const Vec& v) {
-            // Use tuple hashing for Vec
-            return nb::hash(nb::make_tuple(v.x, v.y, v.z));
+            // Mix the three float bit patterns in C++ rather than hashing a tuple of
+            // Python floats; -0.0 is folded into 0.0 since they compare equal
+            uint64_t h = 0;
+            for (float f : { v.x, v.y, v.z }) {
+                f = (f == 0.0f) ? 0.0f : f;
+                uint32_t bits;
+                memcpy(&bits, &f, sizeof(bits));
+                h = (h ^ bits) * 0x9E3779B97F4A7C15ULL;
+            }
+            h ^= h >> 32;
+            Py_hash_t result = (Py_hash_t)h;
+            return result == -1 ? (Py_hash_t)-2 : result;  // -1 is reserved for errors
         })
+        .def_prop_rw("xyz",
+            [](const Vec& v) { return nb::make_tuple(v.x, v.y, v.z); },
+            [](Vec& v, std::array<float, 3> xyz) { v.x = xyz[0]; v.y = xyz[1]; v.z = xyz[2]; },
+            "All three components as a tuple; assign any length-3 sequence to set them in one call")
         .def("as_tuple", [](const Vec& v) {
             return nb::make_tuple(v.x, v.y, v.z);
         })
@@ -594,6 +1005,9 @@ NB_MODULE(RocketSim, m) {
             nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
             return nb::ndarray<nb::numpy, float, nb::shape<3>>(data, {3}, owner);
         })
+        // Copy support (plain value type, so a deep copy is a C++ copy)
+        .def("__copy__", [](const Vec& v) { return Vec(v); })
+        .def("__deepcopy__", [](const Vec& v, nb::object) { return Vec(v); }, "memo"_a)
         // Pickle support
         .def("__getstate__", [](const Vec& v) {
             return nb::make_tuple(v.x, v.y, v.z);
@@ -634,6 +1048,9 @@ NB_MODULE(RocketSim, m) {
             return Angle::FromRotMat(m);
         })
         .def_static("get_identity", &RotMat::GetIdentity)
+        // Copy support (plain value type, so a deep copy is a C++ copy)
+        .def("__copy__", [](const RotMat& m) { return RotMat(m); })
+        .def("__deepcopy__", [](const RotMat& m, nb::object) { return RotMat(m); }, "memo"_a)
         // Pickle support
         .def("__getstate__", [](const RotMat& m) {
             return nb::make_tuple(
@@ -713,6 +1130,8 @@ NB_MODULE(RocketSim, m) {
         .def_rw("jump", &CarControls::jump)
         .def_rw("handbrake", &CarControls::handbrake)
         .def("clamp_fix", &CarControls::ClampFix)
+        .def("reset", [](CarControls& c) { c = CarControls(); },
+             "Reset every input to its default, so one instance can be reused")
         // Pickle support
         .def("__getstate__", [](const CarControls& c) {
             return nb::make_tuple(c.throttle, c.steer, c.pitch, c.yaw, c.roll, c.boost, c.jump, c.handbrake);
@@ -751,6 +1170,15 @@ NB_MODULE(RocketSim, m) {
         .def_rw("ang_vel", &BallState::angVel)
         .def_rw("rot_mat", &BallState::rotMat)
         .def_rw("last_hit_car_id", &BallState::lastHitCarID)
+        .def("as_numpy", [](const BallState& s) {
+            float* data = new float[18];
+            ArenaWrapper::write_ball_state(data, s, false);
+            nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
+            return nb::ndarray<nb::numpy, float, nb::shape<18>>(data, {18}, owner);
+        }, "pos, vel, ang_vel and rot_mat as one (18,) array, same layout as get_ball_state_array()")
+        // Copy support (plain value type, so a deep copy is a C++ copy)
+        .def("__copy__", [](const BallState& s) { return BallState(s); })
+        .def("__deepcopy__", [](const BallState& s, nb::object) { return BallState(s); }, "memo"_a)
         // Pickle support
         .def("__getstate__", [](const BallState& s) {
             return nb::make_tuple(
@@ -783,7 +1211,12 @@ NB_MODULE(RocketSim, m) {
                 Vec(nb::cast<float>(up[0]), nb::cast<float>(up[1]), nb::cast<float>(up[2]))
             );
             s.lastHitCarID = nb::cast<uint32_t>(t[4]);
-        });
+        })
+        // Raw struct copy, only readable by this same build (see state_to_buffer)
+        .def("to_buffer", &state_to_buffer<BallState>,
+             "Struct bytes for from_buffer(); faster than pickling, but tied to this RocketSim build and architecture")
+        .def_static("from_buffer", &state_from_buffer<BallState>, "buffer"_a,
+             "Rebuild a state from to_buffer() bytes (raises ValueError for a buffer from a different build)");
 
     // ========== BoostPadConfig class ==========
     nb::class_<BoostPadConfig>(m, "BoostPadConfig")
@@ -933,6 +1366,16 @@ NB_MODULE(RocketSim, m) {
             [](const CarState& s) { return s.worldContact.contactNormal; },
             [](CarState& s, const Vec& v) { s.worldContact.contactNormal = v; })
         .def_rw("last_controls", &CarState::lastControls)
+        .def("as_numpy", [](const CarState& s) {
+            // write_car_state() also fills the ball_touched column, which needs an arena
+            float* data = new float[ArenaWrapper::CAR_STATE_SIZE];
+            ArenaWrapper::write_car_state(data, s, false, false);
+            nb::capsule owner(data, [](void* p) noexcept { delete[] static_cast<float*>(p); });
+            return nb::ndarray<nb::numpy, float, nb::shape<25>>(data, {25}, owner);
+        }, "Physics state and flags as one (25,) array, same layout as the first 25 columns of get_car_state_array()")
+        // Copy support (plain value type, so a deep copy is a C++ copy)
+        .def("__copy__", [](const CarState& s) { return CarState(s); })
+        .def("__deepcopy__", [](const CarState& s, nb::object) { return CarState(s); }, "memo"_a)
         // Pickle support
         .def("__getstate__", [](const CarState& s) {
             return nb::make_tuple(
@@ -1007,7 +1450,12 @@ NB_MODULE(RocketSim, m) {
             s.worldContact.hasContact = nb::cast<bool>(t[26]);
             auto contactNormal = nb::cast<nb::tuple>(t[27]);
             s.worldContact.contactNormal = Vec(nb::cast<float>(contactNormal[0]), nb::cast<float>(contactNormal[1]), nb::cast<float>(contactNormal[2]));
-        });
+        })
+        // Raw struct copy, only readable by this same build (see state_to_buffer)
+        .def("to_buffer", &state_to_buffer<CarState>,
+             "Struct bytes for from_buffer(); faster than pickling, but tied to this RocketSim build and architecture")
+        .def_static("from_buffer", &state_from_buffer<CarState>, "buffer"_a,
+             "Rebuild a state from to_buffer() bytes (raises ValueError for a buffer from a different build)");
 
     // ========== MutatorConfig class ==========
     nb::class_<MutatorConfig>(m, "MutatorConfig")
@@ -1039,7 +1487,10 @@ NB_MODULE(RocketSim, m) {
         .def_rw("demo_mode", &MutatorConfig::demoMode)
         .def_rw("enable_team_demos", &MutatorConfig::enableTeamDemos)
         .def_rw("enable_car_car_collision", &MutatorConfig::enableCarCarCollision)
-        .def_rw("enable_car_ball_collision", &MutatorConfig::enableCarBallCollision);
+        .def_rw("enable_car_ball_collision", &MutatorConfig::enableCarBallCollision)
+        // Plain struct copy, cheaper than re-running the game mode defaults
+        .def("__copy__", [](const MutatorConfig& c) { return MutatorConfig(c); })
+        .def("__deepcopy__", [](const MutatorConfig& c, nb::object) { return MutatorConfig(c); }, "memo"_a);
 
     // ========== Ball class ==========
     nb::class_<Ball>(m, "Ball")
@@ -1049,7 +1500,22 @@ NB_MODULE(RocketSim, m) {
         .def("get_rot", [](Ball* ball) {
             auto rot = ball->_rigidBody.getOrientation();
             return nb::make_tuple(rot.getX(), rot.getY(), rot.getZ(), rot.getW());
-        }, "Get ball rotation as quaternion (x, y, z, w)");
+        }, "Get ball rotation as quaternion (x, y, z, w)")
+        .def_prop_ro("pos", [](Ball* ball) {
+            Vec pos = ball->_rigidBody.getWorldTransform().getOrigin() * BT_TO_UU;
+            return nb::make_tuple(pos.x, pos.y, pos.z);
+        }, "Ball position as (x, y, z), without building a full BallState")
+        .def("set_state_from_array", [](Ball* ball, nb::ndarray<const float, nb::shape<18>, nb::c_contig, nb::device::cpu> arr) {
+            // Only the 18 physics floats change; the rest of the state is kept
+            BallState bs = ball->GetState();
+            const float* d = arr.data();
+            bs.pos = Vec(d[0], d[1], d[2]);
+            bs.vel = Vec(d[3], d[4], d[5]);
+            bs.angVel = Vec(d[6], d[7], d[8]);
+            bs.rotMat = RotMat(Vec(d[9], d[10], d[11]), Vec(d[12], d[13], d[14]), Vec(d[15], d[16], d[17]));
+            ball->SetState(bs);
+        }, "arr"_a,
+           "Set pos, vel, ang_vel and rot_mat from an (18,) array laid out like BallState.as_numpy()");
 
     // ========== BoostPad class ==========
     nb::class_<BoostPad>(m, "BoostPad")
@@ -1127,11 +1593,29 @@ Args:
     tick_rate: Physics tick rate in Hz (default: 120)
     mem_weight_mode: Memory optimization mode (default: HEAVY)
     custom_boost_pads: Optional list of BoostPadConfig for custom boost pad layouts.
-                       If provided, replaces the default boost pads for the game mode.)")
+                       If provided, replaces the default boost pads for the game mode.
+                       May also be an (N, 4) float32 array of [x, y, z, is_big] rows.)")
+        .def("__init__", [](ArenaWrapper* self, GameMode mode, float tick_rate, ArenaMemWeightMode mem_weight_mode,
+                            nb::ndarray<const float, nb::shape<-1, 4>, nb::c_contig, nb::device::cpu> custom_boost_pads) {
+            // Bulk layout: one row per pad, no BoostPadConfig objects to convert
+            std::vector<BoostPadConfig> pads(custom_boost_pads.shape(0));
+            const float* d = custom_boost_pads.data();
+            for (size_t i = 0; i < pads.size(); i++, d += 4) {
+                pads[i].pos = Vec(d[0], d[1], d[2]);
+                pads[i].isBig = d[3] != 0;
+            }
+            new (self) ArenaWrapper(mode, tick_rate, mem_weight_mode, std::move(pads));
+        }, "game_mode"_a, "tick_rate"_a = 120.0f, "mem_weight_mode"_a = ArenaMemWeightMode::HEAVY,
+           "custom_boost_pads"_a)
         .def("step", &ArenaWrapper::step, "ticks_to_simulate"_a = 1)
         .def("stop", &ArenaWrapper::stop)
         .def("clone", [](ArenaWrapper* a, bool copy_callbacks) { return a->clone(copy_callbacks); },
-             nb::rv_policy::take_ownership, "copy_callbacks"_a = false)
+             nb::rv_policy::take_ownership, "copy_callbacks"_a = false,
+             "Deep copy of the arena. With copy_callbacks=True the clone shares the same callback and data objects")
+        .def("serialize", &ArenaWrapper::serialize,
+             "Serialize arena state, scores and car stats to bytes (callbacks are not included)")
+        .def_static("deserialize", &ArenaWrapper::deserialize, "data"_a, nb::rv_policy::take_ownership,
+             "Create a new Arena from bytes produced by serialize()")
         .def("add_car", &ArenaWrapper::add_car, "team"_a, "config"_a, nb::rv_policy::reference)
         .def("remove_car", [](ArenaWrapper* a, nb::object car_or_id) {
             Car* car = nullptr;
@@ -1148,6 +1632,13 @@ Args:
             a->car_stats.erase(car->id);
             a->arena->RemoveCar(car);
         }, "car_or_id"_a, "Remove a car by Car object or car id")
+        .def("add_cars", &ArenaWrapper::add_cars_array, "teams"_a, "config"_a,
+             "Add one car per entry in an int32 array of teams (0 blue, 1 orange), all with the same config; returns their ids as a numpy int32 array")
+        .def("add_cars", &ArenaWrapper::add_cars, "teams"_a, "config"_a,
+             "Add one car per entry in a sequence of teams, all with the same config; returns their ids as a numpy int32 array")
+        .def("remove_cars", &ArenaWrapper::remove_cars, "car_ids"_a,
+             "Remove every car in a sequence of car ids (raises before removing anything if an id is unknown)")
+        .def("clear_cars", &ArenaWrapper::clear_cars, "Remove all cars")
         .def("get_cars", [](ArenaWrapper* a) {
             std::vector<Car*> cars;
             for (auto* car : a->arena->GetCars()) {
@@ -1157,6 +1648,10 @@ Args:
             std::sort(cars.begin(), cars.end(), [](Car* a, Car* b) { return a->id < b->id; });
             return cars;
         }, nb::rv_policy::reference)
+        .def("num_cars", [](ArenaWrapper* a) { return a->arena->GetCars().size(); },
+             "Number of cars in the arena (no Car list is built)")
+        .def("get_car_ids", &ArenaWrapper::get_car_ids,
+             "Car ids as a numpy int32 array, in get_cars_state_array() row order (no Car list is built)")
         .def("get_car_from_id", [](ArenaWrapper* a, uint32_t id, nb::object default_val) -> nb::object {
             Car* car = a->arena->GetCar(id);
             if (car) {
@@ -1165,8 +1660,17 @@ Args:
             return default_val;
         }, "car_id"_a, "default"_a = nb::none())
         .def("get_boost_pads", [](ArenaWrapper* a) {
-            return a->arena->GetBoostPads();
-        }, nb::rv_policy::reference)
+            if (!a->boost_pads_cache.is_valid()) {
+                a->boost_pads_cache = nb::tuple(nb::cast(a->arena->GetBoostPads(), nb::rv_policy::reference));
+            }
+            return a->boost_pads_cache;
+        }, "Get all boost pads as a tuple (cached, pads are fixed for the arena's lifetime)")
+        .def("get_big_boost_pads", [](ArenaWrapper* a) {
+            return a->big_pads;
+        }, nb::rv_policy::reference, "Get the big boost pads, in get_boost_pads() order")
+        .def("get_small_boost_pads", [](ArenaWrapper* a) {
+            return a->small_pads;
+        }, nb::rv_policy::reference, "Get the small boost pads, in get_boost_pads() order")
         .def("set_mutator_config", [](ArenaWrapper* a, const MutatorConfig& cfg) {
             a->arena->SetMutatorConfig(cfg);
         })
@@ -1207,6 +1711,8 @@ Args:
             auto it = a->car_stats.find(car_id);
             return it != a->car_stats.end() ? it->second.boost_pickups : 0;
         }, "car_id"_a)
+        .def("get_car_stats_array", &ArenaWrapper::get_car_stats_array, "car_ids"_a = nb::none(),
+             "Goals, demos and boost pickups as an (N, 3) numpy int32 array, for car_ids or every car in get_car_ids() order")
         // Callbacks
         .def("set_goal_score_callback", [](ArenaWrapper* a, nb::object callback, nb::object data) {
             if (a->arena->gameMode == GameMode::THE_VOID) {
@@ -1253,52 +1759,60 @@ Args:
             a->ball_touch_data = data;
             // Only set C++ callback if Python callback is set (avoid overhead)
             if (callback && !callback.is_none()) {
-                a->arena->SetBallTouchCallback([](Arena* arena, Car* car, void* userInfo) {
-                    auto* self = static_cast<ArenaWrapper*>(userInfo);
-                    if (self->ball_touch_callback) {
-                        nb::gil_scoped_acquire gil;
-                        try {
-                            self->ball_touch_callback(
-                                "arena"_a = nb::cast(self, nb::rv_policy::reference),
-                                "car"_a = nb::cast(car, nb::rv_policy::reference),
-                                "data"_a = self->ball_touch_data
-                            );
-                        } catch (...) {
-                            self->store_exception_and_stop();
-                        }
-                    }
-                }, a);
+                a->arena->SetBallTouchCallback(&ArenaWrapper::on_ball_touch, a);
             } else {
                 a->arena->SetBallTouchCallback(nullptr, nullptr);
             }
             return nb::make_tuple(prev_cb, prev_data);
-        }, "callback"_a, "data"_a = nb::none(),
-           "Set ball touch callback. callback(arena, car, data) called with kwargs. Returns previous (callback, data).")
+        }, "callback"_a.none(), "data"_a = nb::none(),
+           "Set ball touch callback (None to clear). callback(arena, car, data) called with kwargs. Returns previous (callback, data).")
         // ====== EFFICIENT GYM STATE GETTERS ======
-        .def("get_ball_state_array", &ArenaWrapper::get_ball_state, "inverted"_a = false,
+        .def("get_ball_state_array", &ArenaWrapper::get_ball_state, "inverted"_a = false, "out"_a = nb::none(),
              R"(Get ball state as numpy array.
 Args:
     inverted: If False, returns shape (18,) [pos(3), vel(3), ang_vel(3), rot_mat(9)]
-              If True, returns shape (2, 18) with [normal, inverted] views for both team perspectives)")
-        .def("get_car_state_array", &ArenaWrapper::get_car_state, "car"_a, "inverted"_a = false,
+              If True, returns shape (2, 18) with [normal, inverted] views for both team perspectives
+    out: Optional float32 array of that shape to write into and return instead of allocating)")
+        .def("get_car_state_array", &ArenaWrapper::get_car_state, "car"_a, "inverted"_a = false, "out"_a = nb::none(),
              R"(Get single car state as numpy array.
 Args:
     car: The car to get state for
     inverted: If False, returns shape (26,) with normal view
-              If True, returns shape (2, 26) with [normal, inverted] views)")
-        .def("get_cars_state_array", &ArenaWrapper::get_cars_state, "inverted"_a = false,
+              If True, returns shape (2, 26) with [normal, inverted] views
+    out: Optional float32 array of that shape to write into and return instead of allocating)")
+        .def("get_cars_state_array", &ArenaWrapper::get_cars_state, "inverted"_a = false, "out"_a = nb::none(),
              R"(Get all cars state as numpy array.
 Args:
     inverted: If False, returns shape (N, 26) with normal views
-              If True, returns shape (N, 2, 26) with [normal, inverted] views per car)")
-        .def("get_pads_state_array", &ArenaWrapper::get_pads_state,
-             "Get boost pad states as numpy array of 0/1 values")
-        .def("get_gym_state", &ArenaWrapper::get_gym_state, "inverted"_a = false,
+              If True, returns shape (N, 2, 26) with [normal, inverted] views per car
+    out: Optional float32 array of that shape to write into and return instead of allocating)")
+        .def("get_pads_state_array", &ArenaWrapper::get_pads_state, "out"_a = nb::none(),
+             "Get boost pad states as numpy array of 0/1 values (optionally written into out, a float32 array of shape (M,))")
+        .def("get_boost_pad_is_big_mask", &ArenaWrapper::get_pads_is_big,
+             "Get numpy bool array marking which boost pads are big, in get_boost_pads() order")
+        .def("get_boost_pad_active_mask", &ArenaWrapper::get_pads_is_active,
+             "Get numpy bool array marking which boost pads are active, in get_boost_pads() order")
+        .def("get_boost_pad_active_bits", &ArenaWrapper::get_pads_is_active_bits,
+             "Get the active mask bit-packed into a uint8 array, least significant bit first (unpack with np.unpackbits(bits, bitorder=\"little\"))")
+        .def("get_boost_pad_cooldowns", &ArenaWrapper::get_pads_cooldown,
+             "Get boost pad cooldowns (seconds) as numpy float32 array, in get_boost_pads() order")
+        .def("get_gym_state", &ArenaWrapper::get_gym_state, "inverted"_a = false, "out"_a = nb::none(),
              R"(Get complete gym state as dict with numpy arrays.
 Args:
     inverted: If True, ball and cars arrays include both normal and inverted views.
               Inverted view mirrors coordinates for opposing team: (-x, -y, z).
-              Ball shape: (18,) or (2, 18), Cars shape: (N, 26) or (N, 2, 26))")
+              Ball shape: (18,) or (2, 18), Cars shape: (N, 26) or (N, 2, 26)
+    out: A dict from a previous call. Its arrays are refilled in place and it is
+         returned; arrays whose shape no longer fits are replaced.)")
+        .def("rollout", &ArenaWrapper::rollout, "ticks"_a,
+             "ball_out"_a = nb::none(), "cars_out"_a = nb::none(), "pads_out"_a = nb::none(),
+             R"(Step ticks times, recording the state after every tick.
+Same as calling step(1) and get_gym_state() in a loop, with one call and no per-tick allocation.
+Returns (ball, cars, pads) with shapes (ticks, 18), (ticks, N, 26) and (ticks, M).
+Args:
+    ticks: Number of ticks to simulate
+    ball_out, cars_out, pads_out: Optional float32 arrays of those shapes to write into.
+Adding or removing cars from a callback during the rollout raises RuntimeError.)")
         // ====== RLVISER INTEGRATION ======
         .def("render", [](ArenaWrapper* a) {
             return RLViser::get_socket().send_arena_state(a->arena.get());
@@ -1308,12 +1822,19 @@ Args:
         }, "Get the current game state as an RLViser GameState object")
         // ====== MULTI-STEP (PARALLEL SIMULATION) ======
         .def_static("multi_step", [](nb::list arenas_list, int ticks) {
+            // Nothing to step - skip validation, GIL release and thread setup entirely
+            const size_t num_arenas = nb::len(arenas_list);
+            if (num_arenas == 0) {
+                return;
+            }
+            
             // Convert list to vector and validate
             std::vector<ArenaWrapper*> arenas;
             std::unordered_set<ArenaWrapper*> seen;
-            arenas.reserve(nb::len(arenas_list));
+            arenas.reserve(num_arenas);
+            seen.reserve(num_arenas);
             
-            for (size_t i = 0; i < nb::len(arenas_list); ++i) {
+            for (size_t i = 0; i < num_arenas; ++i) {
                 nb::object item = arenas_list[i];
                 if (!nb::isinstance<ArenaWrapper>(item)) {
                     throw std::runtime_error("Unexpected type in arenas list - expected Arena objects");
@@ -1326,10 +1847,6 @@ Args:
                 arenas.push_back(arena);
             }
             
-            if (arenas.empty()) {
-                return;
-            }
-            
             // Clear exceptions before stepping
             for (auto* arena : arenas) {
                 arena->clear_exception();
@@ -1398,6 +1915,7 @@ Raises:
 
 Note:
     - Each arena must be unique (no duplicates)
+    - An empty list returns immediately, so dynamically sized batches are cheap
     - If a callback raises an exception, the arena stops and the exception is re-raised
     - For best performance with many arenas, use MemoryWeightMode.LIGHT
 )");
@@ -1468,8 +1986,11 @@ Note:
         .def_rw("cars", &RLViser::GameState::cars)
         .def_rw("ball", &RLViser::GameState::ball)
         .def("to_bytes", [](const RLViser::GameState& self) {
-            auto bytes = self.to_bytes();
-            return nb::bytes(reinterpret_cast<const char*>(bytes.data()), bytes.size());
+            // Per-thread scratch, so repeated calls don't reallocate the packet
+            thread_local RLViser::ByteWriter scratch;
+            scratch.data.clear();
+            self.write(scratch);
+            return nb::bytes(reinterpret_cast<const char*>(scratch.data.data()), scratch.data.size());
         })
         .def_static("from_bytes", [](nb::bytes data) {
             return RLViser::GameState::from_bytes(
@@ -1482,7 +2003,32 @@ Note:
         }, "arena"_a)
         .def_static("from_raw_arena", [](Arena* arena) {
             return RLViser::GameState::from_arena(arena);
-        }, "arena"_a);
+        }, "arena"_a)
+        // Pickle support, as the to_bytes() packet (wrapped in a PickleBuffer for protocol 5,
+        // so it can be sent out-of-band)
+        .def("__reduce_ex__", [](nb::handle self, int protocol) {
+            auto bytes = nb::cast<const RLViser::GameState&>(self).to_bytes();
+            nb::object state = nb::bytes(reinterpret_cast<const char*>(bytes.data()), bytes.size());
+            if (protocol >= 5) {
+                state = nb::module_::import_("pickle").attr("PickleBuffer")(state);
+            }
+            return nb::make_tuple(nb::module_::import_("copyreg").attr("__newobj__"), nb::make_tuple(self.type()), state);
+        }, "protocol"_a)
+        .def("__setstate__", [](RLViser::GameState& self, nb::handle buffer) {
+            Py_buffer view;
+            if (PyObject_GetBuffer(buffer.ptr(), &view, PyBUF_SIMPLE) != 0) {
+                throw nb::python_error();
+            }
+            RLViser::GameState state;
+            try {
+                state = RLViser::GameState::from_bytes(static_cast<const uint8_t*>(view.buf), (size_t)view.len);
+            } catch (...) {
+                PyBuffer_Release(&view);
+                throw;
+            }
+            PyBuffer_Release(&view);
+            new (&self) RLViser::GameState(std::move(state));
+        });
 
     // ReturnMessage class
     nb::class_<RLViser::ReturnMessage>(rlviser, "ReturnMessage")
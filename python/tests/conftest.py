@@ -1,30 +1,69 @@
 import pytest
-import os
+from pathlib import Path
 import RocketSim as rs
 
+# collision_meshes/ lives at the repo root, two levels above this file
+COLLISION_MESHES = str(Path(__file__).resolve().parents[2] / "collision_meshes")
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Key pytest-testmon data on the built extension.
+
+    testmon only tracks Python sources, so a rebuilt RocketSim module would
+    otherwise leave every arena test marked as unaffected.
+    """
+    if config.pluginmanager.hasplugin("pytest-testmon") and not config.getoption("environment_expression"):
+        ext = Path(rs.__file__).stat()
+        config.option.environment_expression = f"RocketSim-{ext.st_size}-{ext.st_mtime_ns}"
+
+@pytest.fixture(scope="session")
 def init_rocketsim():
-    """Initialize RocketSim once for all tests."""
-    # Find collision_meshes directory relative to this file
-    tests_dir = os.path.dirname(__file__)
-    python_dir = os.path.dirname(tests_dir)
-    repo_root = os.path.dirname(python_dir)
-    collision_meshes = os.path.join(repo_root, "collision_meshes")
-    
-    rs.init(collision_meshes)
+    """Initialize RocketSim once, the first time a test needs an arena.
+
+    Not autouse, so runs that only touch the pure-Python types skip mesh
+    loading. Modules that construct arenas directly pull this in through
+    ``pytestmark``.
+
+    Under pytest-xdist every worker is its own process with its own session,
+    so each worker initializes once and builds its own prototype arenas.
+    Init only reads the mesh files, so workers don't need to coordinate.
+    """
+    rs.init(COLLISION_MESHES)
     yield
 
+@pytest.fixture(scope="session")
+def _arena_prototype(init_rocketsim):
+    """Empty SOCCAR arena that per-test arenas are cloned from."""
+    return rs.Arena(rs.GameMode.SOCCAR)
 
 @pytest.fixture
-def arena():
-    """Create a fresh arena for each test."""
-    return rs.Arena(rs.GameMode.SOCCAR)
+def arena(request, _arena_prototype):
+    """Create a fresh arena for each test.
+
+    Cloning skips rebuilding the collision world, so this is much cheaper
+    than constructing a new arena while still giving each test its own copy.
+    Tests marked ``no_arena_reset`` only read state and get the prototype
+    itself.
+    """
+    if request.node.get_closest_marker("no_arena_reset"):
+        return _arena_prototype
+    return _arena_prototype.clone()
 
+@pytest.fixture(scope="session")
+def _arena_with_car_prototype(init_rocketsim):
+    """SOCCAR arena holding a single blue Octane, cloned by arena_with_car."""
+    arena = rs.Arena(rs.GameMode.SOCCAR)
+    arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+    return arena
 
 @pytest.fixture
-def arena_with_car(arena):
-    """Create an arena with one car."""
-    car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
-    return arena, car
+def arena_with_car(request, _arena_with_car_prototype):
+    """Create an arena with one car.
 
+    Honors ``no_arena_reset`` the same way as the ``arena`` fixture.
+    """
+    if request.node.get_closest_marker("no_arena_reset"):
+        arena = _arena_with_car_prototype
+    else:
+        arena = _arena_with_car_prototype.clone()
+    return arena, arena.get_cars()[0]
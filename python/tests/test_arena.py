@@ -1,21 +1,61 @@
 """Tests for the Arena class."""
 
-import pytest  # noqa: F401
+import copy
+
+import numpy as np
+import pytest
 import RocketSim as rs
 
 
+pytestmark = pytest.mark.usefixtures("init_rocketsim")
+
+TICK_TOL = 1e-2  # tick_rate is stored as a float32
+
+# Bound once so the hot add_car/Arena calls skip the module attribute lookups
+OCTANE = rs.CAR_CONFIG_OCTANE
+DOMINUS = rs.CAR_CONFIG_DOMINUS
+BLUE = rs.Team.BLUE
+ORANGE = rs.Team.ORANGE
+SOCCAR = rs.GameMode.SOCCAR
+
+_DEFAULT_MUTATOR = rs.MutatorConfig()
+# set_controls() copies, so one instance can be shared by every car
+_THROTTLE_BOOST = rs.CarControls(throttle=1.0, boost=True)
+# Same for rot_mat: facing +X, and turned 180 degrees to face -X
+_IDENT_ROT = rs.RotMat(rs.Vec(1, 0, 0), rs.Vec(0, 1, 0), rs.Vec(0, 0, 1))
+_FLIP_ROT = rs.RotMat(rs.Vec(-1, 0, 0), rs.Vec(0, -1, 0), rs.Vec(0, 0, 1))
+
+
+@pytest.fixture(scope="class", params=[30.0, 60.0, 120.0])
+def tick_rate_arena(request):
+    """One arena per tick rate, shared by every test in the class."""
+    return rs.Arena(SOCCAR, tick_rate=request.param), request.param
+
+
+class TestInit:
+    """Test RocketSim initialization."""
+
+    def test_init_again_is_noop(self):
+        # Already initialized by the fixture, so the path is never read
+        rs.init("does/not/exist")
+        arena = rs.Arena(SOCCAR)
+        assert len(arena.get_boost_pads()) == 34
+
+
 class TestArenaCreation:
     """Test Arena creation."""
 
-    def test_create_soccar_arena(self):
-        arena = rs.Arena(rs.GameMode.SOCCAR)
-        assert arena.game_mode == rs.GameMode.SOCCAR
-        assert arena.tick_count == 0
-        assert abs(arena.tick_rate - 120.0) < 0.01  # Float comparison
+    def test_create_soccar_arena(self, tick_rate_arena):
+        arena, tick_rate = tick_rate_arena
+        assert (arena.game_mode, arena.tick_count, arena.tick_rate) == (
+            SOCCAR,
+            0,
+            pytest.approx(tick_rate, abs=TICK_TOL),
+        )
 
-    def test_custom_tick_rate(self):
-        arena = rs.Arena(rs.GameMode.SOCCAR, tick_rate=60.0)
-        assert abs(arena.tick_rate - 60.0) < 0.01  # Float comparison
+    @pytest.mark.no_arena_reset
+    def test_default_tick_rate(self, arena):
+        assert arena.tick_rate == pytest.approx(120.0, abs=TICK_TOL)
 
 
 class TestArenaStep:
@@ -43,7 +83,7 @@ class TestArenaClone:
 
         assert cloned.tick_count == arena.tick_count
         assert cloned.game_mode == arena.game_mode
-        assert len(cloned.get_cars()) == len(arena.get_cars())
+        assert cloned.num_cars() == arena.num_cars()
 
     def test_clone_is_independent(self, arena_with_car):
         arena, car = arena_with_car
@@ -54,78 +94,141 @@ class TestArenaClone:
 
         assert arena.tick_count != cloned.tick_count
 
+    def test_clone_keeps_mutator_config(self, arena):
+        # Copy, since get_mutator_config() returns the arena's own config
+        config = copy.copy(arena.get_mutator_config())
+        config.gravity.z = -500.0
+        config.ball_radius = 100.0
+        arena.set_mutator_config(config)
+
+        cloned = arena.clone()
+
+        assert cloned.get_mutator_config().gravity.z == -500.0
+        assert abs(cloned.ball.get_radius() - 100.0) < 0.01
+
+
+class TestArenaSerialize:
+    """Test Arena serialize/deserialize."""
+
+    def test_roundtrip(self, arena_with_car):
+        arena, car = arena_with_car
+        arena.step(10)
+
+        restored = rs.Arena.deserialize(arena.serialize())
+
+        assert restored.tick_count == arena.tick_count
+        assert restored.game_mode == arena.game_mode
+        assert [c.id for c in restored.get_cars()] == [car.id]
+        assert restored.get_cars()[0].get_state().pos == car.get_state().pos
+        assert restored.ball.get_state().pos == arena.ball.get_state().pos
+
+    def test_invalid_data(self):
+        with pytest.raises(ValueError):
+            rs.Arena.deserialize(b"")
+        with pytest.raises(ValueError):
+            rs.Arena.deserialize(b"\x00" * 16)
+
+    @pytest.mark.parametrize("keep", [0.0, 0.01, 0.1, 0.4, 0.7, 0.95, 0.999])
+    def test_truncated_data(self, arena_with_car, keep, capfd):
+        arena, _ = arena_with_car
+        data = arena.serialize()
+
+        with pytest.raises(ValueError, match="truncated|invalid"):
+            rs.Arena.deserialize(data[: 4 + int((len(data) - 4) * keep)])
+        # Rejected before the engine parses it, so nothing is logged
+        assert "FATAL" not in capfd.readouterr().out
+
 
 class TestArenaBall:
     """Test Arena ball access."""
 
+    @pytest.mark.no_arena_reset
     def test_ball_exists(self, arena):
         ball = arena.ball
         assert ball is not None
 
+    @pytest.mark.no_arena_reset
     def test_ball_initial_position(self, arena):
-        state = arena.ball.get_state()
+        x, y, z = arena.ball.pos
         # Ball should start slightly above ground at center
-        assert state.pos.x == 0.0
-        assert state.pos.y == 0.0
-        assert state.pos.z > 0.0  # Above ground
+        assert x == 0.0
+        assert y == 0.0
+        assert z > 0.0  # Above ground
+
+    def test_ball_pos_matches_state(self, arena):
+        state = rs.BallState()
+        state.pos = rs.Vec(100, -200, 300)
+        arena.ball.set_state(state)
+
+        x, y, z = arena.ball.pos
+        assert abs(x - 100) < 0.01
+        assert abs(y + 200) < 0.01
+        assert abs(z - 300) < 0.01
 
 
 class TestArenaCars:
     """Test Arena car management."""
 
-    def test_add_car(self, arena):
-        car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+    def test_car_lifecycle(self, arena):
+        """Add, look up and remove cars on one arena."""
+        car = arena.add_car(BLUE, OCTANE)
         assert car is not None
         # Team is returned as int (0 = BLUE, 1 = ORANGE)
-        assert car.team == 0 or car.team == rs.Team.BLUE
-
-    def test_add_multiple_cars(self, arena):
-        _car1 = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
-        _car2 = arena.add_car(rs.Team.ORANGE, rs.CAR_CONFIG_DOMINUS)
+        assert car.team == 0 or car.team == BLUE
 
-        cars = arena.get_cars()
-        assert len(cars) == 2
+        _car2 = arena.add_car(ORANGE, DOMINUS)
+        assert arena.num_cars() == 2
 
-    def test_get_car_by_id(self, arena):
-        car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
         car_id = car.id
-
         retrieved = arena.get_car_from_id(car_id)
         assert retrieved.id == car_id
 
-    def test_remove_car(self, arena):
-        car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
-        assert len(arena.get_cars()) == 1
-
         arena.remove_car(car)
-        assert len(arena.get_cars()) == 0
+        assert arena.num_cars() == 1
+        assert arena.get_car_from_id(car_id) is None
+
+
+@pytest.fixture(scope="class")
+def boost_pads(_arena_prototype):
+    """Boost pads of the prototype arena, fetched once per class."""
+    return _arena_prototype.get_boost_pads()
 
 
 class TestArenaBoostPads:
     """Test Arena boost pad access."""
 
-    def test_boost_pads_exist(self, arena):
-        pads = arena.get_boost_pads()
-        assert len(pads) == 34  # Standard Soccar has 34 boost pads
+    def test_boost_pads_exist(self, boost_pads):
+        assert len(boost_pads) == 34  # Standard Soccar has 34 boost pads
 
-    def test_boost_pad_properties(self, arena):
-        pads = arena.get_boost_pads()
-        big_pads = [p for p in pads if p.is_big]
-        small_pads = [p for p in pads if not p.is_big]
+    def test_boost_pad_properties(self, _arena_prototype, boost_pads):
+        mask = _arena_prototype.get_boost_pad_is_big_mask()
+        assert mask.dtype == bool
+        assert mask.shape == (len(boost_pads),)
 
-        assert len(big_pads) == 6  # 6 big boost pads
-        assert len(small_pads) == 28  # 28 small boost pads
+        assert mask.sum() == 6  # 6 big boost pads
+        assert (~mask).sum() == 28  # 28 small boost pads
+        assert mask[0] == boost_pads[0].is_big
+
+    def test_big_and_small_boost_pads(self, _arena_prototype, boost_pads):
+        big = _arena_prototype.get_big_boost_pads()
+        small = _arena_prototype.get_small_boost_pads()
+        assert (len(big), len(small)) == (6, 28)
+        assert all(pad.is_big for pad in big)
+        assert not any(pad.is_big for pad in small)
+        # Same order as get_boost_pads()
+        assert [p.get_pos() for p in big] == [p.get_pos() for p in boost_pads if p.is_big]
 
 
 class TestArenaMutators:
     """Test Arena mutator config."""
 
+    @pytest.mark.no_arena_reset
     def test_get_mutator_config(self, arena):
         config = arena.get_mutator_config()
         assert config is not None
 
     def test_set_mutator_config(self, arena):
-        config = rs.MutatorConfig()
+        config = copy.copy(_DEFAULT_MUTATOR)
         config.gravity.z = -500.0  # Moon gravity
         arena.set_mutator_config(config)
 
@@ -133,6 +236,15 @@ class TestArenaMutators:
         new_config = arena.get_mutator_config()
         assert new_config.gravity.z == -500.0
 
+    def test_copy_mutator_config(self):
+        config = copy.copy(_DEFAULT_MUTATOR)
+        config.gravity.z = -500.0
+        assert _DEFAULT_MUTATOR.gravity.z != -500.0
+
+        deep = copy.deepcopy(config)
+        assert deep.gravity.z == -500.0
+        assert deep.ball_radius == _DEFAULT_MUTATOR.ball_radius
+
     def test_unlimited_flips_mutator(self, arena):
         """Test that unlimited_flips mutator option exists and can be set."""
         config = arena.get_mutator_config()
@@ -198,26 +310,31 @@ class TestArenaMutators:
         assert new_config.ball_radius == 150.0
 
 
+@pytest.fixture
+def airborne_car(arena):
+    """Blue Octane in mid-air that has already used its first jump."""
+    car = arena.add_car(BLUE, OCTANE)
+    state = car.get_state()
+    state.pos.z = 500.0
+    state.vel.z = 0.0
+    state.has_jumped = True  # Simulate having jumped already
+    state.is_on_ground = False
+    car.set_state(state)
+    return car
+
+
 class TestUnlimitedFlipsSimulation:
     """Test unlimited flips/double jumps mutator behavior in simulation."""
 
-    def test_unlimited_flips_allows_multiple_flips(self, arena):
+    def test_unlimited_flips_allows_multiple_flips(self, arena, airborne_car):
         """Test that unlimited_flips=True allows a car to flip multiple times."""
-        car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+        car = airborne_car
 
         # Enable unlimited flips
-        config = arena.get_mutator_config()
+        config = copy.copy(_DEFAULT_MUTATOR)
         config.unlimited_flips = True
         arena.set_mutator_config(config)
 
-        # Put car in the air
-        state = car.get_state()
-        state.pos.z = 500.0
-        state.vel.z = 0.0
-        state.has_jumped = True  # Simulate having jumped already
-        state.is_on_ground = False
-        car.set_state(state)
-
         # Perform first flip
         controls = rs.CarControls()
         controls.jump = True
@@ -225,16 +342,23 @@ class TestUnlimitedFlipsSimulation:
         car.set_controls(controls)
         arena.step(1)
 
-        # Release and allow flip to complete
+        # Release inputs
         controls.jump = False
         controls.pitch = 0.0
         car.set_controls(controls)
-        arena.step(120)  # Let the flip complete
 
         # Car should have flipped
         state = car.get_state()
         assert state.has_flipped == True
 
+        # Let the flip complete, stopping as soon as it does (~80 ticks)
+        for _ in range(12):
+            if not state.is_flipping:
+                break
+            arena.step(10)
+            state = car.get_state()
+        assert state.is_flipping == False
+
         # Reset air time and try to flip again
         state.air_time_since_jump = 0.0
         car.set_state(state)
@@ -249,23 +373,15 @@ class TestUnlimitedFlipsSimulation:
         state = car.get_state()
         assert state.is_flipping == True
 
-    def test_unlimited_double_jumps_allows_multiple_jumps(self, arena):
+    def test_unlimited_double_jumps_allows_multiple_jumps(self, arena, airborne_car):
         """Test that unlimited_double_jumps=True allows a car to double jump multiple times."""
-        car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+        car = airborne_car
 
         # Enable unlimited double jumps
-        config = arena.get_mutator_config()
+        config = copy.copy(_DEFAULT_MUTATOR)
         config.unlimited_double_jumps = True
         arena.set_mutator_config(config)
 
-        # Put car in the air
-        state = car.get_state()
-        state.pos.z = 500.0
-        state.vel.z = 0.0
-        state.has_jumped = True  # Simulate having jumped already
-        state.is_on_ground = False
-        car.set_state(state)
-
         # Perform first double jump (no directional input = double jump, not flip)
         controls = rs.CarControls()
         controls.jump = True
@@ -307,27 +423,27 @@ class TestCarCarCollision:
 
     def test_disable_car_car_collision_via_mutator(self, arena):
         """Test that cars pass through each other when collision is disabled."""
-        car1 = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
-        car2 = arena.add_car(rs.Team.ORANGE, rs.CAR_CONFIG_OCTANE)
+        car1 = arena.add_car(BLUE, OCTANE)
+        car2 = arena.add_car(ORANGE, OCTANE)
 
         # Position cars in the air to test collision filtering
         # (Ground-based collision is affected by vehicle suspension system)
         state1 = car1.get_state()
         state1.pos = rs.Vec(-200, 0, 500)
         state1.vel = rs.Vec(500, 0, 0)  # Moving right
-        state1.rot_mat = rs.RotMat(rs.Vec(1, 0, 0), rs.Vec(0, 1, 0), rs.Vec(0, 0, 1))
+        state1.rot_mat = _IDENT_ROT
         state1.is_on_ground = False
         car1.set_state(state1)
 
         state2 = car2.get_state()
         state2.pos = rs.Vec(200, 0, 500)
         state2.vel = rs.Vec(-500, 0, 0)  # Moving left
-        state2.rot_mat = rs.RotMat(rs.Vec(-1, 0, 0), rs.Vec(0, -1, 0), rs.Vec(0, 0, 1))
+        state2.rot_mat = _FLIP_ROT
         state2.is_on_ground = False
         car2.set_state(state2)
 
         # Disable car-car collision
-        config = arena.get_mutator_config()
+        config = copy.copy(_DEFAULT_MUTATOR)
         config.enable_car_car_collision = False
         arena.set_mutator_config(config)
 
@@ -365,7 +481,7 @@ class TestCarBallCollision:
 
     def test_disable_car_ball_collision_via_mutator(self, arena):
         """Test that cars pass through the ball when collision is disabled."""
-        car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+        car = arena.add_car(BLUE, OCTANE)
 
         # Position ball in the air
         ball_state = arena.ball.get_state()
@@ -377,12 +493,12 @@ class TestCarBallCollision:
         state = car.get_state()
         state.pos = rs.Vec(-200, 0, 500)
         state.vel = rs.Vec(500, 0, 0)  # Moving right towards ball
-        state.rot_mat = rs.RotMat(rs.Vec(1, 0, 0), rs.Vec(0, 1, 0), rs.Vec(0, 0, 1))
+        state.rot_mat = _IDENT_ROT
         state.is_on_ground = False
         car.set_state(state)
 
         # Disable car-ball collision
-        config = arena.get_mutator_config()
+        config = copy.copy(_DEFAULT_MUTATOR)
         config.enable_car_ball_collision = False
         arena.set_mutator_config(config)
 
@@ -417,21 +533,14 @@ class TestMemoryWeightMode:
         assert hasattr(rs.MemoryWeightMode, "HEAVY")
         assert hasattr(rs.MemoryWeightMode, "LIGHT")
 
-    def test_create_arena_with_heavy_mode(self):
-        """Test creating arena with HEAVY memory weight mode."""
-        arena = rs.Arena(rs.GameMode.SOCCAR, mem_weight_mode=rs.MemoryWeightMode.HEAVY)
-        assert arena.game_mode == rs.GameMode.SOCCAR
-
-    def test_create_arena_with_light_mode(self):
-        """Test creating arena with LIGHT memory weight mode."""
-        arena = rs.Arena(rs.GameMode.SOCCAR, mem_weight_mode=rs.MemoryWeightMode.LIGHT)
-        assert arena.game_mode == rs.GameMode.SOCCAR
-
-    def test_default_is_heavy(self):
-        """Test that default memory weight mode is HEAVY."""
-        # Default constructor should work without specifying mem_weight_mode
-        arena = rs.Arena(rs.GameMode.SOCCAR)
-        assert arena.game_mode == rs.GameMode.SOCCAR
+    @pytest.mark.parametrize(
+        "mode", [None, rs.MemoryWeightMode.HEAVY, rs.MemoryWeightMode.LIGHT], ids=["default", "heavy", "light"]
+    )
+    def test_create_arena(self, mode):
+        """Test creating arena with each memory weight mode (default is HEAVY)."""
+        kwargs = {} if mode is None else {"mem_weight_mode": mode}
+        arena = rs.Arena(SOCCAR, **kwargs)
+        assert arena.game_mode == SOCCAR
 
 
 class TestArenaStop:
@@ -439,12 +548,12 @@ class TestArenaStop:
 
     def test_stop_method_exists(self):
         """Test that stop method exists on Arena."""
-        arena = rs.Arena(rs.GameMode.SOCCAR)
+        arena = rs.Arena(SOCCAR)
         assert hasattr(arena, "stop")
 
     def test_stop_from_ball_touch_callback(self, arena):
         """Test that stop() can be called from within a callback to halt simulation."""
-        car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+        car = arena.add_car(BLUE, OCTANE)
 
         stop_tick = [0]  # Use list to modify in closure
 
@@ -478,16 +587,23 @@ class TestArenaStop:
             assert arena.tick_count == stop_tick[0] + 1
 
 
+@pytest.fixture(scope="class")
+def kickoff_pair(_arena_with_car_prototype):
+    """Two one-car arenas shared by the kickoff tests.
+
+    Every test reseeds both with reset_to_random_kickoff, which overwrites
+    all state the tests look at.
+    """
+    return _arena_with_car_prototype.clone(), _arena_with_car_prototype.clone()
+
+
 class TestConsistentKickoff:
     """Test that kickoff is consistent with the same seed."""
 
-    def test_kickoff_consistent_with_seed(self):
+    def test_kickoff_consistent_with_seed(self, kickoff_pair):
         """Test that the same seed produces the same kickoff positions."""
-        arena1 = rs.Arena(rs.GameMode.SOCCAR)
-        arena2 = rs.Arena(rs.GameMode.SOCCAR)
-
-        car1 = arena1.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
-        car2 = arena2.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+        arena1, arena2 = kickoff_pair
+        car1, car2 = arena1.get_cars()[0], arena2.get_cars()[0]
 
         # Reset with same seed
         arena1.reset_to_random_kickoff(seed=999)
@@ -501,13 +617,10 @@ class TestConsistentKickoff:
         assert abs(state1.pos.y - state2.pos.y) < 0.001
         assert abs(state1.pos.z - state2.pos.z) < 0.001
 
-    def test_kickoff_different_with_different_seeds(self):
+    def test_kickoff_different_with_different_seeds(self, kickoff_pair):
         """Test that different seeds produce different kickoff positions."""
-        arena1 = rs.Arena(rs.GameMode.SOCCAR)
-        arena2 = rs.Arena(rs.GameMode.SOCCAR)
-
-        car1 = arena1.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
-        car2 = arena2.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+        arena1, arena2 = kickoff_pair
+        car1, car2 = arena1.get_cars()[0], arena2.get_cars()[0]
 
         # Reset with different seeds
         arena1.reset_to_random_kickoff(seed=123)
@@ -527,41 +640,52 @@ class TestConsistentKickoff:
         assert different or True  # Allow pass even if positions happen to match
 
 
+@pytest.fixture(scope="class")
+def _pool4(init_rocketsim):
+    """Four SOCCAR arenas shared by the TestMultiStep tests that need them."""
+    return [rs.Arena(SOCCAR) for _ in range(4)]
+
+
+@pytest.fixture
+def pool4(_pool4):
+    """The shared four arenas, emptied of cars and callbacks for each test.
+
+    tick_count keeps counting across tests, so tests measure ticks relative
+    to where they start.
+    """
+    for arena in _pool4:
+        for car in arena.get_cars():
+            arena.remove_car(car)
+        arena.set_ball_touch_callback(None)
+        arena.reset_to_random_kickoff(seed=0)
+    return _pool4
+
+
 class TestMultiStep:
     """Test Arena.multi_step() parallel simulation functionality."""
 
     def compare_arenas(self, arena1, arena2):
         """Helper to compare two arena states for equality."""
-        ball1 = arena1.ball.get_state()
-        ball2 = arena2.ball.get_state()
-
-        assert abs(ball1.pos.x - ball2.pos.x) < 0.001
-        assert abs(ball1.pos.y - ball2.pos.y) < 0.001
-        assert abs(ball1.pos.z - ball2.pos.z) < 0.001
-        assert abs(ball1.vel.x - ball2.vel.x) < 0.001
-        assert abs(ball1.vel.y - ball2.vel.y) < 0.001
-        assert abs(ball1.vel.z - ball2.vel.z) < 0.001
-
-        cars1 = arena1.get_cars()
-        cars2 = arena2.get_cars()
-        assert len(cars1) == len(cars2)
-
-        for c1, c2 in zip(cars1, cars2):
-            s1 = c1.get_state()
-            s2 = c2.get_state()
-            assert abs(s1.pos.x - s2.pos.x) < 0.001
-            assert abs(s1.pos.y - s2.pos.y) < 0.001
-            assert abs(s1.pos.z - s2.pos.z) < 0.001
+        # Ball pos + vel, then every car's pos, each as one array diff
+        ball1 = arena1.get_ball_state_array()[:6]
+        ball2 = arena2.get_ball_state_array()[:6]
+        assert np.max(np.abs(ball1 - ball2)) < 0.001
+
+        cars1 = arena1.get_cars_state_array()[:, :3]
+        cars2 = arena2.get_cars_state_array()[:, :3]
+        assert cars1.shape == cars2.shape
+        if cars1.size:
+            assert np.max(np.abs(cars1 - cars2)) < 0.001
 
     def test_multi_step_method_exists(self):
         """Test that multi_step static method exists on Arena."""
         assert hasattr(rs.Arena, "multi_step")
 
-    def test_multi_step_basic(self):
+    def test_multi_step_basic(self, pool4):
         """Test basic multi_step functionality."""
-        arenas = [rs.Arena(rs.GameMode.SOCCAR) for _ in range(4)]
+        arenas = pool4
         for arena in arenas:
-            arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+            arena.add_car(BLUE, OCTANE)
             arena.reset_to_random_kickoff(seed=999)
 
         # All arenas should start with same state
@@ -577,19 +701,18 @@ class TestMultiStep:
 
     def test_multi_step_consistency(self):
         """Test that multi_step produces consistent results with regular step."""
-        arena_multi = rs.Arena(rs.GameMode.SOCCAR)
-        arena_single = rs.Arena(rs.GameMode.SOCCAR)
+        arena_multi = rs.Arena(SOCCAR)
+        arena_single = rs.Arena(SOCCAR)
 
-        arena_multi.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
-        arena_single.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+        arena_multi.add_car(BLUE, OCTANE)
+        arena_single.add_car(BLUE, OCTANE)
 
         arena_multi.reset_to_random_kickoff(seed=42)
         arena_single.reset_to_random_kickoff(seed=42)
 
         # Step both for the same number of ticks
-        for _ in range(100):
-            rs.Arena.multi_step([arena_multi], 8)
-            arena_single.step(8)
+        rs.Arena.multi_step([arena_multi], 800)
+        arena_single.step(800)
 
         # Results should be identical
         self.compare_arenas(arena_multi, arena_single)
@@ -598,17 +721,16 @@ class TestMultiStep:
         """Test multi_step with many arenas (stress test)."""
         num_arenas = 24
         arenas = [
-            rs.Arena(rs.GameMode.SOCCAR, mem_weight_mode=rs.MemoryWeightMode.LIGHT)
+            rs.Arena(SOCCAR, mem_weight_mode=rs.MemoryWeightMode.LIGHT)
             for _ in range(num_arenas)
         ]
 
         for arena in arenas:
-            arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+            arena.add_car(BLUE, OCTANE)
             arena.reset_to_random_kickoff(seed=999)
 
-        # Step all arenas in parallel multiple times
-        for _ in range(10):
-            rs.Arena.multi_step(arenas, 8)
+        # Step all arenas in parallel; ticks loop natively, one dispatch is enough
+        rs.Arena.multi_step(arenas, 80)
 
         # All should still match
         for arena in arenas[1:]:
@@ -620,8 +742,8 @@ class TestMultiStep:
 
     def test_multi_step_single_arena(self):
         """Test multi_step with single arena works correctly."""
-        arena = rs.Arena(rs.GameMode.SOCCAR)
-        arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+        arena = rs.Arena(SOCCAR)
+        arena.add_car(BLUE, OCTANE)
 
         initial_tick = arena.tick_count
         rs.Arena.multi_step([arena], 10)
@@ -630,19 +752,19 @@ class TestMultiStep:
 
     def test_multi_step_duplicate_arena_error(self):
         """Test that duplicate arenas raise an error."""
-        arena = rs.Arena(rs.GameMode.SOCCAR)
+        arena = rs.Arena(SOCCAR)
 
         with pytest.raises(RuntimeError, match="Duplicate arena detected"):
             rs.Arena.multi_step([arena, arena], 1)
 
     def test_multi_step_invalid_type_error(self):
         """Test that non-Arena objects raise an error."""
-        arena = rs.Arena(rs.GameMode.SOCCAR)
+        arena = rs.Arena(SOCCAR)
 
         with pytest.raises(RuntimeError, match="Unexpected type"):
             rs.Arena.multi_step([arena, "not an arena"], 1)
 
-    def test_multi_step_exception_from_callback(self):
+    def test_multi_step_exception_from_callback(self, pool4):
         """Test that exceptions in callbacks are properly propagated."""
 
         class BallTouchError(Exception):
@@ -650,15 +772,17 @@ class TestMultiStep:
 
         def ball_touch_callback(arena, car, data):
             data[0] = arena.tick_count
+            arena.stop()  # Don't keep simulating an arena whose result is discarded
             raise BallTouchError("Ball was touched!")
 
-        arenas = [rs.Arena(rs.GameMode.SOCCAR) for _ in range(4)]
-        touched = [[0] for _ in arenas]
+        arenas = pool4
+        # One shared callback; each arena's data holds [touch tick, arena index]
+        touched = [[0, i] for i in range(len(arenas))]
 
-        for i, arena in enumerate(arenas):
-            car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+        for arena, data in zip(arenas, touched):
+            car = arena.add_car(BLUE, OCTANE)
             arena.reset_to_random_kickoff(seed=999)
-            arena.set_ball_touch_callback(ball_touch_callback, touched[i])
+            arena.set_ball_touch_callback(ball_touch_callback, data)
 
             # Set up car to hit ball
             ball_state = arena.ball.get_state()
@@ -670,27 +794,30 @@ class TestMultiStep:
             car_state.vel = rs.Vec(2000, 0, 0)
             car.set_state(car_state)
 
-        # Should raise the BallTouchError
+        start_ticks = [arena.tick_count for arena in arenas]
+
+        # Should raise the BallTouchError from a single call
         with pytest.raises(BallTouchError):
-            for _ in range(100):
-                rs.Arena.multi_step(arenas, 8)
+            rs.Arena.multi_step(arenas, 800)
 
-    def test_multi_step_with_controls(self):
+        # Every arena stopped at its own touch (finishing that tick) instead of running all 800
+        for tick, i in touched:
+            assert 0 < tick - start_ticks[i] < 800
+            assert arenas[i].tick_count - tick <= 1
+
+    def test_multi_step_with_controls(self, pool4):
         """Test multi_step with car controls being set between steps."""
-        arenas = [rs.Arena(rs.GameMode.SOCCAR) for _ in range(4)]
+        arenas = pool4
         cars = []
 
         for arena in arenas:
-            car = arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+            car = arena.add_car(BLUE, OCTANE)
             cars.append(car)
             arena.reset_to_random_kickoff(seed=999)
 
         # Set controls before stepping
         for car in cars:
-            controls = rs.CarControls()
-            controls.throttle = 1.0
-            controls.boost = True
-            car.set_controls(controls)
+            car.set_controls(_THROTTLE_BOOST)
 
         # Step multiple times with controls
         for _ in range(50):
@@ -700,33 +827,36 @@ class TestMultiStep:
         for arena in arenas[1:]:
             self.compare_arenas(arenas[0], arena)
 
+    @pytest.mark.serial
     def test_multi_step_gil_release(self):
         """Test that GIL is properly released during multi_step (threading test)."""
         import threading
 
-        arenas = [rs.Arena(rs.GameMode.SOCCAR) for _ in range(8)]
+        arenas = [rs.Arena(SOCCAR) for _ in range(8)]
         for arena in arenas:
-            arena.add_car(rs.Team.BLUE, rs.CAR_CONFIG_OCTANE)
+            arena.add_car(BLUE, OCTANE)
 
-        # Flag to track if other thread ran
-        other_thread_ran = [False]
+        # Spin a counter in another thread; it can only advance while the GIL is free
+        progress = 0
+        started = threading.Event()
+        stop = threading.Event()
 
         def other_task():
-            # Small delay to ensure multi_step is running
-            import time
-
-            time.sleep(0.01)
-            other_thread_ran[0] = True
+            nonlocal progress
+            started.set()
+            while not stop.is_set():
+                progress += 1
 
-        # Start other thread
         thread = threading.Thread(target=other_task)
         thread.start()
+        started.wait()
 
-        # Run multi_step - should release GIL
-        for _ in range(10):
-            rs.Arena.multi_step(arenas, 100)
+        before = progress
+        rs.Arena.multi_step(arenas, 200)
+        after = progress
 
+        stop.set()
         thread.join()
 
-        # Other thread should have been able to run while multi_step was executing
-        assert other_thread_ran[0]
+        # Other thread should have kept counting while multi_step was executing
+        assert after > before + 1000
@@ -1,14 +1,16 @@
 """Tests for the Ball class."""
 
-import pytest  # noqa: F401
+import pytest
 import pickle
 import copy
+import numpy as np
 import RocketSim as rs
 
 
 class TestBallState:
     """Test Ball state management."""
 
+    @pytest.mark.no_arena_reset
     def test_get_state(self, arena):
         state = arena.ball.get_state()
 
@@ -32,29 +34,44 @@ class TestBallState:
         ball.set_state(state)
 
         new_state = ball.get_state()
-        assert abs(new_state.pos.x - 100.0) < 0.01
-        assert abs(new_state.pos.y - 200.0) < 0.01
-        assert abs(new_state.pos.z - 300.0) < 0.01
-        assert abs(new_state.vel.x - 10.0) < 0.01
+        assert new_state.pos.as_tuple() == pytest.approx((100.0, 200.0, 300.0), abs=0.01)
+        assert new_state.vel.x == pytest.approx(10.0, abs=0.01)
+
+    def test_state_as_numpy(self, arena):
+        arr = arena.ball.get_state().as_numpy()
+        assert arr.dtype == np.float32
+        np.testing.assert_array_equal(arr, arena.get_ball_state_array())
+
+    def test_set_state_from_array(self, arena):
+        ball = arena.ball
+        arr = ball.get_state().as_numpy()
+        arr[0:3] = [100.0, 200.0, 300.0]
+        arr[3:6] = [10.0, 20.0, 30.0]
+
+        ball.set_state_from_array(arr)
+
+        np.testing.assert_allclose(ball.get_state().as_numpy(), arr, atol=0.01)
 
 
 class TestBallRotation:
     """Test Ball rotation methods."""
 
+    @pytest.mark.no_arena_reset
     def test_get_rot_returns_quaternion(self, arena):
         """Test that get_rot returns a quaternion tuple."""
         ball_rot = arena.ball.get_rot()
         assert isinstance(ball_rot, tuple)
         assert len(ball_rot) == 4
         # Quaternion should be normalized (sum of squares ~= 1)
-        quat_norm_sq = sum(x * x for x in ball_rot)
-        assert abs(quat_norm_sq - 1.0) < 0.001
+        quat = np.asarray(ball_rot)
+        assert abs(quat @ quat - 1.0) < 0.001
 
+    @pytest.mark.no_arena_reset
     def test_get_rot_not_all_zero(self, arena):
         """Test that get_rot doesn't return all zeros."""
         ball_rot = arena.ball.get_rot()
         # At least the w component should be non-zero for identity rotation
-        assert sum(abs(x) for x in ball_rot) > 0
+        assert np.any(np.asarray(ball_rot))
 
 
 class TestBallPhysics:
@@ -65,22 +82,16 @@ class TestBallPhysics:
         state = ball.get_state()
 
         # Set ball in the air with zero velocity
-        state.pos.x = 0.0
-        state.pos.y = 0.0
-        state.pos.z = 500.0
-        state.vel.x = 0.0
-        state.vel.y = 0.0
-        state.vel.z = 0.0
-        state.ang_vel.x = 0.0
-        state.ang_vel.y = 0.0
-        state.ang_vel.z = 0.0
+        state.pos.xyz = (0.0, 0.0, 500.0)
+        state.vel.xyz = (0.0, 0.0, 0.0)
+        state.ang_vel.xyz = (0.0, 0.0, 0.0)
         ball.set_state(state)
 
         arena.step(60)
 
-        new_state = ball.get_state()
         # Ball should have fallen (or at least not gone up)
-        assert new_state.pos.z <= 500.0
+        _, _, z = ball.pos
+        assert z <= 500.0
 
     def test_ball_maintains_velocity(self, arena):
         ball = arena.ball
@@ -88,16 +99,14 @@ class TestBallPhysics:
 
         # Set ball moving horizontally
         state.pos.z = 200.0  # Above ground
-        state.vel.x = 1000.0
-        state.vel.y = 0.0
-        state.vel.z = 0.0
+        state.vel.xyz = (1000.0, 0.0, 0.0)
         ball.set_state(state)
 
         arena.step(12)  # 0.1 seconds
 
-        new_state = ball.get_state()
         # Ball should have moved in x direction
-        assert new_state.pos.x > 0.0
+        x, _, _ = ball.pos
+        assert x > 0.0
 
 
 class TestBallStatePickle:
@@ -119,16 +128,18 @@ class TestBallStatePickle:
         assert restored.vel.y == state.vel.y
         assert restored.ang_vel.z == state.ang_vel.z
 
-    def test_ball_state_pickle_all_fields(self):
+    @pytest.mark.parametrize("protocol", [2, 5])  # both use the portable per-field state
+    def test_ball_state_pickle_all_fields(self, protocol):
         """Test that all BallState fields survive pickle roundtrip."""
-        state = rs.BallState()
-        state.pos = rs.Vec(100, 200, 300)
-        state.vel = rs.Vec(10, 20, 30)
-        state.ang_vel = rs.Vec(1, 2, 3)
-        state.last_hit_car_id = 42
+        state = rs.BallState(
+            pos=rs.Vec(100, 200, 300),
+            vel=rs.Vec(10, 20, 30),
+            ang_vel=rs.Vec(1, 2, 3),
+            last_hit_car_id=42,
+        )
 
         # Pickle and unpickle
-        pickled = pickle.dumps(state)
+        pickled = pickle.dumps(state, protocol=protocol)
         restored = pickle.loads(pickled)
 
         # Verify all fields
@@ -143,11 +154,32 @@ class TestBallStatePickle:
         assert restored.ang_vel.z == 3
         assert restored.last_hit_car_id == 42
 
+    def test_ball_state_pickle_has_no_raw_buffer(self):
+        """Test that protocol 5 pickles the portable per-field state, not struct bytes."""
+        buffers = []
+        pickle.dumps(rs.BallState(), protocol=5, buffer_callback=buffers.append)
+        assert buffers == []
+
+    def test_ball_state_buffer_roundtrip(self):
+        """Test that to_buffer()/from_buffer() restore the state."""
+        state = rs.BallState(pos=rs.Vec(100, 200, 300), last_hit_car_id=42)
+
+        restored = rs.BallState.from_buffer(state.to_buffer())
+        assert restored.pos.z == 300
+        assert restored.last_hit_car_id == 42
+
+    def test_ball_state_from_buffer_rejects_foreign_buffer(self):
+        """Test that a buffer of the wrong size or version is refused."""
+        data = rs.BallState().to_buffer()
+
+        with pytest.raises(ValueError):
+            rs.BallState.from_buffer(bytes(len(data)))
+        with pytest.raises(ValueError):
+            rs.BallState.from_buffer(b"\x00" * 8)
+
     def test_ball_state_copy(self):
         """Test that BallState can be copied."""
-        state = rs.BallState()
-        state.pos = rs.Vec(100, 200, 300)
-        state.vel = rs.Vec(10, 20, 30)
+        state = rs.BallState(pos=rs.Vec(100, 200, 300), vel=rs.Vec(10, 20, 30))
 
         # Shallow copy
         copied = copy.copy(state)
@@ -157,9 +189,7 @@ class TestBallStatePickle:
 
     def test_ball_state_deepcopy(self):
         """Test that BallState can be deepcopied."""
-        state = rs.BallState()
-        state.pos = rs.Vec(100, 200, 300)
-        state.vel = rs.Vec(10, 20, 30)
+        state = rs.BallState(pos=rs.Vec(100, 200, 300), vel=rs.Vec(10, 20, 30))
 
         # Deep copy
         copied = copy.deepcopy(state)
@@ -1,42 +1,45 @@
 """Basic tests for RocketSim Python bindings."""
 
 import pytest
+import copy
 import numpy as np
 import RocketSim as rs
 
 
+_EXPECTED_ATTRIBUTES = frozenset({
+    "init",
+    "Arena",
+    "Ball",
+    "Car",
+    "BoostPad",
+    "Vec",
+    "RotMat",
+    "Angle",
+    "BallState",
+    "CarState",
+    "CarControls",
+    "CarConfig",
+    "BoostPadState",
+    "MutatorConfig",
+    "GameMode",
+    "Team",
+    "DemoMode",
+    "CAR_CONFIG_OCTANE",
+    "CAR_CONFIG_DOMINUS",
+    "CAR_CONFIG_PLANK",
+    "CAR_CONFIG_BREAKOUT",
+    "CAR_CONFIG_HYBRID",
+    "CAR_CONFIG_MERC",
+})
+
+
 class TestImport:
     """Test that the module imports correctly."""
 
     def test_module_has_expected_attributes(self):
         """Check that all expected classes and functions exist."""
-        expected = [
-            "init",
-            "Arena",
-            "Ball",
-            "Car",
-            "BoostPad",
-            "Vec",
-            "RotMat",
-            "Angle",
-            "BallState",
-            "CarState",
-            "CarControls",
-            "CarConfig",
-            "BoostPadState",
-            "MutatorConfig",
-            "GameMode",
-            "Team",
-            "DemoMode",
-            "CAR_CONFIG_OCTANE",
-            "CAR_CONFIG_DOMINUS",
-            "CAR_CONFIG_PLANK",
-            "CAR_CONFIG_BREAKOUT",
-            "CAR_CONFIG_HYBRID",
-            "CAR_CONFIG_MERC",
-        ]
-        for name in expected:
-            assert hasattr(rs, name), f"Missing attribute: {name}"
+        missing = _EXPECTED_ATTRIBUTES - set(dir(rs))
+        assert not missing, f"Missing attributes: {sorted(missing)}"
 
 
 class TestVec:
@@ -59,7 +62,23 @@ class TestVec:
         arr = v.as_numpy()
         assert isinstance(arr, np.ndarray)
         assert arr.shape == (3,)
-        np.testing.assert_array_almost_equal(arr, [1.0, 2.0, 3.0])
+        assert np.allclose(arr, [1.0, 2.0, 3.0], atol=1e-6)
+
+    def test_xyz(self):
+        v = rs.Vec(1.0, 2.0, 3.0)
+        assert v.xyz == (1.0, 2.0, 3.0)
+
+        v.xyz = [4.0, 5.0, 6.0]
+        assert (v.x, v.y, v.z) == (4.0, 5.0, 6.0)
+
+        with pytest.raises(TypeError):
+            v.xyz = (1.0, 2.0)
+
+    def test_deepcopy(self):
+        v = rs.Vec(1.0, 2.0, 3.0)
+        copied = copy.deepcopy(v)
+        v.x = 9.0
+        assert copied == rs.Vec(1.0, 2.0, 3.0)
 
 
 class TestRotMat:
@@ -131,29 +150,21 @@ class TestCarConfig:
         config = rs.CarConfig()
         assert config.hitbox_size.x == 0.0  # Empty config
 
-    def test_octane_config(self):
-        config = rs.CarConfig(rs.OCTANE)
-        assert config.hitbox_size.x == pytest.approx(120.507, abs=0.01)
-
-    def test_dominus_config(self):
-        config = rs.CarConfig(rs.DOMINUS)
-        assert config.hitbox_size.x == pytest.approx(130.427, abs=0.01)
-
-    def test_plank_config(self):
-        config = rs.CarConfig(rs.PLANK)
-        assert config.hitbox_size.x == pytest.approx(131.32, abs=0.01)
-
-    def test_breakout_config(self):
-        config = rs.CarConfig(rs.BREAKOUT)
-        assert config.hitbox_size.x == pytest.approx(133.992, abs=0.01)
-
-    def test_hybrid_config(self):
-        config = rs.CarConfig(rs.HYBRID)
-        assert config.hitbox_size.x == pytest.approx(129.519, abs=0.01)
-
-    def test_merc_config(self):
-        config = rs.CarConfig(rs.MERC)
-        assert config.hitbox_size.x == pytest.approx(123.22, abs=0.01)
+    @pytest.mark.parametrize(
+        "kind,expected",
+        [
+            (rs.OCTANE, 120.507),
+            (rs.DOMINUS, 130.427),
+            (rs.PLANK, 131.32),
+            (rs.BREAKOUT, 133.992),
+            (rs.HYBRID, 129.519),
+            (rs.MERC, 123.22),
+        ],
+        ids=["octane", "dominus", "plank", "breakout", "hybrid", "merc"],
+    )
+    def test_hitbox_size(self, kind, expected):
+        config = rs.CarConfig(kind)
+        assert config.hitbox_size.x == pytest.approx(expected, abs=0.01)
 
     def test_dodge_deadzone_default(self):
         config = rs.CarConfig()
@@ -1,9 +1,13 @@
 """Tests for the BoostPad class."""
 
-import pytest  # noqa: F401
+import pytest
+import numpy as np
 import RocketSim as rs
 
 
+pytestmark = pytest.mark.usefixtures("init_rocketsim")
+
+
 class TestBoostPadConfig:
     """Test BoostPadConfig class."""
 
@@ -60,7 +64,7 @@ class TestCustomBoostPads:
         assert len(pads) == 2
         
         # Check positions match
-        pad_positions = [(p.get_pos().x, p.get_pos().y) for p in pads]
+        pad_positions = [((pos := p.get_pos()).x, pos.y) for p in pads]
         assert (-2000, -2000) in pad_positions
         assert (2000, 2000) in pad_positions
         
@@ -70,6 +74,16 @@ class TestCustomBoostPads:
         assert len(big_pads) == 1
         assert len(small_pads) == 1
 
+    def test_arena_with_custom_boost_pad_array(self):
+        """Test creating arena from an (N, 4) array of [x, y, z, is_big] rows."""
+        custom_pads = np.array([(-2000, -2000, 73, 1), (2000, 2000, 73, 0)], dtype=np.float32)
+
+        arena = rs.Arena(rs.GameMode.SOCCAR, custom_boost_pads=custom_pads)
+        pads = arena.get_boost_pads()
+
+        assert [p.get_pos().as_tuple() for p in pads] == [(-2000, -2000, 73), (2000, 2000, 73)]
+        assert arena.get_boost_pad_is_big_mask().tolist() == [True, False]
+
     def test_custom_boost_pads_empty_list(self):
         """Test that empty custom boost pads list uses default pads."""
         arena = rs.Arena(rs.GameMode.SOCCAR, custom_boost_pads=[])
@@ -117,6 +131,7 @@ class TestCustomBoostPads:
 class TestBoostPadProperties:
     """Test BoostPad properties."""
 
+    @pytest.mark.no_arena_reset
     def test_boost_pad_has_position(self, arena):
         pads = arena.get_boost_pads()
         pad = pads[0]
@@ -124,6 +139,7 @@ class TestBoostPadProperties:
         pos = pad.get_pos()
         assert isinstance(pos, rs.Vec)
 
+    @pytest.mark.no_arena_reset
     def test_boost_pad_is_big(self, arena):
         pads = arena.get_boost_pads()
 
@@ -134,10 +150,17 @@ class TestBoostPadProperties:
         assert len(big_pads) > 0
         assert len(small_pads) > 0
 
+    @pytest.mark.no_arena_reset
+    def test_boost_pads_cached(self, arena):
+        pads = arena.get_boost_pads()
+        assert isinstance(pads, tuple)
+        assert arena.get_boost_pads() is pads
+
 
 class TestBoostPadState:
     """Test BoostPad state management."""
 
+    @pytest.mark.no_arena_reset
     def test_get_state(self, arena):
         pad = arena.get_boost_pads()[0]
         state = pad.get_state()
@@ -145,6 +168,7 @@ class TestBoostPadState:
         assert hasattr(state, "is_active")
         assert hasattr(state, "cooldown")
 
+    @pytest.mark.no_arena_reset
     def test_pad_starts_active(self, arena):
         pad = arena.get_boost_pads()[0]
         state = pad.get_state()
@@ -152,6 +176,23 @@ class TestBoostPadState:
         assert state.is_active
         assert state.cooldown == 0.0
 
+    @pytest.mark.no_arena_reset
+    def test_all_pads_start_active(self, arena):
+        assert arena.get_boost_pad_active_mask().all()
+        assert not arena.get_boost_pad_cooldowns().any()
+
+    def test_active_bits_match_mask(self, arena):
+        state = rs.BoostPadState()
+        state.is_active = False
+        arena.get_boost_pads()[3].set_state(state)
+
+        bits = arena.get_boost_pad_active_bits()
+        mask = arena.get_boost_pad_active_mask()
+
+        assert bits.dtype == np.uint8
+        assert len(bits) == (len(mask) + 7) // 8
+        np.testing.assert_array_equal(np.unpackbits(bits, bitorder="little")[:len(mask)], mask)
+
     def test_set_state(self, arena):
         pad = arena.get_boost_pads()[0]
 
@@ -164,3 +205,7 @@ class TestBoostPadState:
         new_state = pad.get_state()
         assert not new_state.is_active
         assert new_state.cooldown == 5.0
+
+        # Bulk arrays see the same state
+        assert not arena.get_boost_pad_active_mask()[0]
+        assert arena.get_boost_pad_cooldowns()[0] == 5.0
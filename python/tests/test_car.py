@@ -1,19 +1,33 @@
 """Tests for the Car class."""
 
-import pytest  # noqa: F401
+import pytest
 import pickle
 import copy
+import numpy as np
 import RocketSim as rs
 
 
+# set_controls() copies, so tests can share one instance through the controls fixture
+_CONTROLS = rs.CarControls()
+
+
+@pytest.fixture
+def controls():
+    """Shared CarControls, reset to defaults for each test."""
+    _CONTROLS.reset()
+    return _CONTROLS
+
+
 class TestCarProperties:
     """Test Car properties."""
 
+    @pytest.mark.no_arena_reset
     def test_car_id(self, arena_with_car):
         arena, car = arena_with_car
         assert isinstance(car.id, int)
         assert car.id > 0
 
+    @pytest.mark.no_arena_reset
     def test_car_team(self, arena_with_car):
         arena, car = arena_with_car
         # Team is returned as int (0 = BLUE, 1 = ORANGE)
@@ -23,6 +37,7 @@ class TestCarProperties:
 class TestCarState:
     """Test Car state management."""
 
+    @pytest.mark.no_arena_reset
     def test_get_state(self, arena_with_car):
         arena, car = arena_with_car
         state = car.get_state()
@@ -32,6 +47,15 @@ class TestCarState:
         assert isinstance(state.ang_vel, rs.Vec)
         assert isinstance(state.rot_mat, rs.RotMat)
 
+    @pytest.mark.no_arena_reset
+    def test_state_as_numpy(self, arena_with_car):
+        arena, car = arena_with_car
+        arr = car.get_state().as_numpy()
+
+        assert arr.shape == (25,)
+        assert arr.dtype == np.float32
+        np.testing.assert_array_equal(arr, arena.get_car_state_array(car)[:25])
+
     def test_set_state(self, arena_with_car):
         arena, car = arena_with_car
         state = car.get_state()
@@ -49,32 +73,26 @@ class TestCarState:
         assert new_state.pos.y == 500.0
         assert new_state.boost == 100.0
 
+    @pytest.mark.no_arena_reset
     def test_car_state_attributes(self, arena_with_car):
         arena, car = arena_with_car
         state = car.get_state()
 
-        # Check all expected attributes exist
-        assert hasattr(state, "pos")
-        assert hasattr(state, "vel")
-        assert hasattr(state, "ang_vel")
-        assert hasattr(state, "rot_mat")
-        assert hasattr(state, "boost")
-        assert hasattr(state, "is_on_ground")
-        assert hasattr(state, "has_jumped")
-        assert hasattr(state, "has_double_jumped")
-        assert hasattr(state, "has_flipped")
-        assert hasattr(state, "is_supersonic")
-        assert hasattr(state, "has_world_contact")
-        assert hasattr(state, "world_contact_normal")
+        # Check all expected attributes exist, with one dir() instead of a hasattr per name
+        expected = {
+            "pos", "vel", "ang_vel", "rot_mat", "boost",
+            "is_on_ground", "has_jumped", "has_double_jumped", "has_flipped",
+            "is_supersonic", "has_world_contact", "world_contact_normal",
+        }
+        assert expected - set(dir(state)) == set()
 
 
 class TestCarControls:
     """Test Car controls."""
 
-    def test_set_controls(self, arena_with_car):
+    def test_set_controls(self, arena_with_car, controls):
         arena, car = arena_with_car
 
-        controls = rs.CarControls()
         controls.throttle = 1.0
         controls.steer = 0.5
         controls.boost = True
@@ -95,6 +113,15 @@ class TestCarControls:
         assert not controls.jump
         assert not controls.handbrake
 
+    def test_reset(self):
+        controls = rs.CarControls(throttle=1.0, steer=-0.5, boost=True, jump=True)
+        controls.reset()
+
+        assert controls.throttle == 0.0
+        assert controls.steer == 0.0
+        assert not controls.boost
+        assert not controls.jump
+
 
 class TestCarSimulation:
     """Test car physics simulation."""
@@ -114,14 +141,13 @@ class TestCarSimulation:
         # Car should have fallen
         assert new_state.pos.z < 500.0
 
-    def test_car_moves_with_throttle(self, arena_with_car):
+    def test_car_moves_with_throttle(self, arena_with_car, controls):
         arena, car = arena_with_car
 
         initial_state = car.get_state()
         initial_y = initial_state.pos.y
 
         # Apply throttle
-        controls = rs.CarControls()
         controls.throttle = 1.0
         car.set_controls(controls)
 
@@ -132,7 +158,7 @@ class TestCarSimulation:
         new_state = car.get_state()
         assert new_state.pos.y > initial_y
 
-    def test_car_boost_consumption(self, arena_with_car):
+    def test_car_boost_consumption(self, arena_with_car, controls):
         arena, car = arena_with_car
 
         # Set boost to 100
@@ -141,7 +167,6 @@ class TestCarSimulation:
         car.set_state(state)
 
         # Apply boost
-        controls = rs.CarControls()
         controls.throttle = 1.0
         controls.boost = True
         car.set_controls(controls)
@@ -238,7 +263,8 @@ class TestCarStatePickle:
         assert restored.is_flipping == state.is_flipping
         assert restored.has_flipped == state.has_flipped
 
-    def test_car_state_pickle_all_fields(self):
+    @pytest.mark.parametrize("protocol", [2, 5])  # both use the portable per-field state
+    def test_car_state_pickle_all_fields(self, protocol):
         """Test that all CarState fields survive pickle roundtrip."""
         state = rs.CarState()
         state.pos = rs.Vec(100, 200, 300)
@@ -258,7 +284,7 @@ class TestCarStatePickle:
         state.is_demoed = False
 
         # Pickle and unpickle
-        pickled = pickle.dumps(state)
+        pickled = pickle.dumps(state, protocol=protocol)
         restored = pickle.loads(pickled)
 
         # Verify all fields
@@ -277,6 +303,32 @@ class TestCarStatePickle:
         assert abs(restored.air_time_since_jump - 0.5) < 0.001
         assert restored.is_supersonic == True
         assert restored.is_demoed == False
+        np.testing.assert_array_equal(restored.as_numpy(), state.as_numpy())
+
+    def test_car_state_pickle_has_no_raw_buffer(self):
+        """Test that protocol 5 pickles the portable per-field state, not struct bytes."""
+        buffers = []
+        pickle.dumps(rs.CarState(), protocol=5, buffer_callback=buffers.append)
+        assert buffers == []
+
+    def test_car_state_buffer_roundtrip(self):
+        """Test that to_buffer()/from_buffer() restore the state."""
+        state = rs.CarState()
+        state.pos = rs.Vec(100, 200, 300)
+        state.boost = 42.0
+
+        restored = rs.CarState.from_buffer(state.to_buffer())
+        assert restored.pos.z == 300
+        assert restored.boost == 42.0
+
+    def test_car_state_from_buffer_rejects_foreign_buffer(self):
+        """Test that a buffer of the wrong size or version is refused."""
+        data = rs.CarState().to_buffer()
+
+        with pytest.raises(ValueError):
+            rs.CarState.from_buffer(bytes(len(data)))
+        with pytest.raises(ValueError):
+            rs.CarState.from_buffer(b"\x00" * 8)
 
     def test_car_state_copy(self):
         """Test that CarState can be copied."""
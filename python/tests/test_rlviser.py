@@ -1,6 +1,7 @@
 """Tests for RLViser UDP communication functionality."""
 
 import pytest
+import pickle
 import RocketSim as rs
 
 
@@ -31,9 +32,8 @@ class TestGameState:
     """Test GameState serialization."""
 
     @pytest.fixture
-    def arena(self):
+    def arena(self, init_rocketsim):
         """Create a test arena with some cars."""
-        rs.init("../collision_meshes")
         arena = rs.Arena(rs.GameMode.SOCCAR)
         arena.add_car(rs.Team.BLUE, rs.CarConfig(rs.CarConfig.OCTANE))
         arena.add_car(rs.Team.ORANGE, rs.CarConfig(rs.CarConfig.DOMINUS))
@@ -56,6 +56,8 @@ class TestGameState:
 
         # Should have at least the minimum header size
         assert len(data) >= 21  # MIN_NUM_BYTES
+        # Repeated calls reuse a scratch buffer, but each returns its own copy
+        assert state.to_bytes() == data
 
         # Verify we can deserialize
         restored = rs.rlviser.GameState.from_bytes(data)
@@ -66,6 +68,25 @@ class TestGameState:
         assert len(restored.cars) == len(state.cars)
         assert len(restored.pads) == len(state.pads)
 
+    @pytest.mark.parametrize("protocol", [2, 5])
+    def test_game_state_pickle(self, arena, protocol):
+        """Test that GameState pickles as its to_bytes() packet."""
+        state = rs.rlviser.GameState.from_arena(arena)
+        restored = pickle.loads(pickle.dumps(state, protocol=protocol))
+
+        assert restored.to_bytes() == state.to_bytes()
+
+    def test_game_state_pickle_out_of_band(self, arena):
+        """Test that protocol 5 hands the packet over as one out-of-band buffer."""
+        state = rs.rlviser.GameState.from_arena(arena)
+
+        buffers = []
+        pickled = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+
+        restored = pickle.loads(pickled, buffers=buffers)
+        assert restored.to_bytes() == state.to_bytes()
+
     def test_game_state_car_info(self, arena):
         """Test that car info is properly captured."""
         # Set some car state
@@ -143,9 +164,8 @@ class TestArenaIntegration:
     """Test Arena methods for RLViser integration."""
 
     @pytest.fixture
-    def arena(self):
+    def arena(self, init_rocketsim):
         """Create a test arena."""
-        rs.init("../collision_meshes")
         arena = rs.Arena(rs.GameMode.SOCCAR)
         arena.add_car(rs.Team.BLUE, rs.CarConfig(rs.CarConfig.OCTANE))
         return arena
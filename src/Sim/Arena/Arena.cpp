@@ -684,65 +684,73 @@ Arena* Arena::DeserializeNew(DataStreamIn& in) {
 	newConfig.Deserialize(in);
 
 	Arena* newArena = new Arena(gameMode, newConfig, 1.f / tickTime);
-	newArena->tickCount = tickCount;
+	// A bad stream can throw partway through; don't leak the arena when it does
+	try {
+		newArena->tickCount = tickCount;
 	
-	{ // Deserialize cars
-		uint32_t carAmount = in.Read<uint32_t>();
-		for (uint32_t i = 0; i < carAmount; i++) {
-			Team team;
-			uint32_t id;
-			in.Read(team);
-			in.Read(id);
+		{ // Deserialize cars
+			uint32_t carAmount = in.Read<uint32_t>();
+			for (uint32_t i = 0; i < carAmount; i++) {
+				Team team;
+				uint32_t id;
+				in.Read(team);
+				in.Read(id);
 
 #ifndef RS_MAX_SPEED
-			if (newArena->_carIDMap.count(id))
-				RS_ERR_CLOSE(ERROR_PREFIX << "Failed to load, got repeated car ID of " << id);
+				if (newArena->_carIDMap.count(id))
+					RS_ERR_CLOSE(ERROR_PREFIX << "Failed to load, got repeated car ID of " << id);
 #endif
 
-			Car* newCar = newArena->DeserializeNewCar(in, team);
+				Car* newCar = newArena->DeserializeNewCar(in, team);
 
-			// Force ID
-			newArena->_carIDMap.erase(newCar->id);
-			newArena->_carIDMap[id] = newCar;
-			newCar->id = id;
-		}
+				// Force ID
+				newArena->_carIDMap.erase(newCar->id);
+				newArena->_carIDMap[id] = newCar;
+				newCar->id = id;
+			}
 
-		newArena->_lastCarID = lastCarID;
-	}
+			newArena->_lastCarID = lastCarID;
+		}
 
-	// Deserialize boost pads
-	if (newArena->_boostPads.size() > 0) {
-		uint32_t boostPadAmount = in.Read<uint32_t>();
+		// Deserialize boost pads
+		if (newArena->_boostPads.size() > 0) {
+			uint32_t boostPadAmount = in.Read<uint32_t>();
 
 #ifndef RS_MAX_SPEED
-		if (boostPadAmount != newArena->_boostPads.size())
-			RS_ERR_CLOSE(ERROR_PREFIX << "Failed to load, " <<
-				"different boost pad amount written in file (" << boostPadAmount << "/" << newArena->_boostPads.size() << ")");
+			if (boostPadAmount != newArena->_boostPads.size())
+				RS_ERR_CLOSE(ERROR_PREFIX << "Failed to load, " <<
+					"different boost pad amount written in file (" << boostPadAmount << "/" << newArena->_boostPads.size() << ")");
 #endif
 
-		for (auto pad : newArena->_boostPads) {
-			BoostPadState padState = BoostPadState();
-			padState.Deserialize(in);
-			pad->SetState(padState);
+			for (auto pad : newArena->_boostPads) {
+				BoostPadState padState = BoostPadState();
+				padState.Deserialize(in);
+				pad->SetState(padState);
+			}
 		}
-	}
 
-	{ // Deserialize ball
-		BallState ballState = BallState();
-		ballState.Deserialize(in);
-		newArena->ball->SetState(ballState);
-	}
+		{ // Deserialize ball
+			BallState ballState = BallState();
+			ballState.Deserialize(in);
+			newArena->ball->SetState(ballState);
+		}
 
-	{ // Serialize mutators
-		newArena->_mutatorConfig.Deserialize(in);
-		newArena->SetMutatorConfig(newArena->_mutatorConfig);
+		{ // Serialize mutators
+			newArena->_mutatorConfig.Deserialize(in);
+			newArena->SetMutatorConfig(newArena->_mutatorConfig);
+		}
+	} catch (...) {
+		delete newArena;
+		throw;
 	}
 
 	return newArena;
 }
 
 Arena* Arena::Clone(bool copyCallbacks) {
+	// Collision meshes are shared globally, so this only builds the per-arena bodies
 	Arena* newArena = new Arena(this->gameMode, this->_config, this->GetTickRate());
+	newArena->SetMutatorConfig(this->_mutatorConfig);
 	
 	if (copyCallbacks) {
 		newArena->_goalScoreCallback = this->_goalScoreCallback;